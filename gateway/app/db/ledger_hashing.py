@@ -12,16 +12,22 @@ Hash canonicalization (stable, locale-independent, deterministic):
 
 Ordering used by verifier:
     ORDER BY occurred_at_utc ASC, event_id ASC
+
+Merkle tree head (reported alongside the chain, never stored):
+    RFC 6962 Merkle Tree Hash over the stored event_hash strings (UTF-8) of
+    a tenant's chain, in verifier order. Publishing it lets an auditor later
+    detect a wholesale rewrite of the chain.
 """
 
 import hashlib
-from typing import Optional
+from typing import Optional, Sequence
 
 # Constants exported so callers can embed them verbatim in JSON output.
 HASH_POLICY = (
     "SHA-256(prev_event_hash||occurred_at_utc||object_type"
     "||object_id||action||event_payload_json)"
 )
+MERKLE_POLICY = "RFC6962-SHA256(event_hash)"
 ORDERING = "occurred_at_utc ASC, event_id ASC"
 
 
@@ -47,3 +53,31 @@ def compute_event_hash(
         f"{prev_hash or ''}{timestamp}{object_type}{object_id}{action}{payload_json}"
     )
     return hash_content(hash_input)
+
+
+def merkle_tree_hash(leaves: Sequence[bytes]) -> str:
+    """Compute the RFC 6962 Merkle Tree Hash of raw leaf data (hex digest).
+
+    Leaves are hashed as SHA-256(0x00 || leaf) and interior nodes as
+    SHA-256(0x01 || left || right). Building levels bottom-up and promoting
+    an unpaired last node unchanged yields exactly the RFC's split-at-the-
+    largest-power-of-two tree. The empty tree hashes to SHA-256("").
+    """
+    level = [hashlib.sha256(b"\x00" + leaf).digest() for leaf in leaves]
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+
+    while len(level) > 1:
+        next_level = [
+            hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return level[0].hex()
+
+
+def compute_merkle_root(event_hashes: Sequence[str]) -> str:
+    """Compute the Merkle tree head over a chain's event hashes, in order."""
+    return merkle_tree_hash([h.encode("utf-8") for h in event_hashes])
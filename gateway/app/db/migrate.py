@@ -135,6 +135,9 @@ def get_connection() -> sqlite3.Connection:
     """
     Get a SQLite database connection.
 
+    No per-connection PRAGMAs are needed: WAL mode is persistent in the
+    database file and is applied once by ensure_schema().
+
     Returns:
         SQLite connection with Row factory enabled.
         Only valid when running against a SQLite backend.
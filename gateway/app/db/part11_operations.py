@@ -15,6 +15,7 @@ from gateway.app.db.ledger_hashing import (
     hash_content,
     compute_event_hash,
 )
+from gateway.app.services.timestamps import parse_utc_timestamp
 
 
 def get_utc_timestamp() -> str:
@@ -374,8 +375,8 @@ def end_review_session(
     )
     row = cursor.fetchone()
     if row:
-        start_time = datetime.fromisoformat(row[0].replace("Z", "+00:00"))
-        end_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        start_time = parse_utc_timestamp(row[0])
+        end_time = parse_utc_timestamp(timestamp)
         duration_ms = int((end_time - start_time).total_seconds() * 1000)
     else:
         duration_ms = None
@@ -6,7 +6,7 @@ integrity certificate issuance.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class ClinicalDocumentationRequest(BaseModel):
@@ -176,6 +176,22 @@ class CertificateIssuanceResponse(BaseModel):
     verify_url: str = Field(..., description="URL to verify this certificate")
 
 
+class CertificateBatchVerifyRequest(BaseModel):
+    """
+    Request to verify several certificates in a single call.
+
+    Note: tenant_id is derived from JWT authentication; certificates belonging
+    to other tenants are reported as not found.
+    """
+
+    certificate_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Certificate identifiers to verify (1-100)",
+    )
+
+
 # Additional models for healthcare-specific routes
 
 
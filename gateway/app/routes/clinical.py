@@ -12,6 +12,7 @@ Security Model:
 
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException, Depends, Request
 from typing import Dict, Any, Optional
 from fastapi.responses import Response
@@ -23,10 +24,12 @@ from gateway.app.models.clinical import (
     ClinicalDocumentationRequest,
     DocumentationIntegrityCertificate,
     CertificateIssuanceResponse,
+    CertificateBatchVerifyRequest,
 )
 from gateway.app.security.auth import Identity, get_current_identity, require_role
 from gateway.app.services.uuid7 import generate_uuid7
 from gateway.app.services.hashing import sha256_hex
+from gateway.app.services.timestamps import parse_utc_timestamp
 from gateway.app.services.signer import sign_generic_message, verify_signature
 from gateway.app.services.verification_interpreter import interpret_verification
 from gateway.app.services.certificate_pdf import generate_certificate_pdf
@@ -35,7 +38,12 @@ from gateway.app.services.evidence_bundle import (
     build_evidence_bundle,
 )
 from gateway.app.services.key_registry import get_key_registry
-from gateway.app.routes.verify_utils import fail
+from gateway.app.routes.verify_utils import (
+    exception_debug,
+    fail,
+    hash_prefix_debug,
+    hashes_match,
+)
 
 router = APIRouter(prefix="/v1", tags=["clinical-documentation"])
 
@@ -56,6 +64,9 @@ def get_clinical_limiter():
 
 limiter = get_clinical_limiter()
 
+# Worker threads for batch verification (ECDSA verify releases the GIL)
+BATCH_VERIFY_MAX_WORKERS = 8
+
 
 def get_tenant_chain_head(tenant_id: str) -> str | None:
     """
@@ -156,7 +167,7 @@ def compute_chain_hash(
     Returns:
         Chain hash as hex string
     """
-    from gateway.app.services.hashing import hash_c14n
+    from gateway.app.services.c14n import json_c14n_v1
 
     chain_payload = {
         "previous_hash": previous_hash,
@@ -168,9 +179,153 @@ def compute_chain_hash(
         "governance_policy_version": certificate_data["governance_policy_version"],
     }
 
-    # Remove sha256: prefix from hash_c14n result
-    full_hash = hash_c14n(chain_payload)
-    return full_hash.replace("sha256:", "")
+    # Chain hashes are stored without the "sha256:" prefix, so hash the
+    # canonical bytes directly instead of building and stripping a prefix
+    return sha256_hex(json_c14n_v1(chain_payload))
+
+
+def verify_certificate_record(
+    certificate_id: str, certificate: Dict[str, Any], tenant_id: str
+) -> Dict[str, Any]:
+    """
+    Run all integrity checks against a loaded certificate.
+
+    The caller is responsible for loading the certificate and enforcing
+    tenant isolation; this function only performs the cryptographic checks.
+
+    Args:
+        certificate_id: Certificate identifier the record was looked up by
+        certificate: Certificate dictionary as stored
+        tenant_id: Tenant whose key registry holds the signing key
+
+    Returns:
+        Verification result with certificate_id, valid, failures and
+        human_friendly_report
+    """
+    failures = []
+
+    # Verify timing integrity
+    finalized_at_str = certificate.get("finalized_at")
+    ehr_referenced_at_str = certificate.get("ehr_referenced_at")
+
+    if finalized_at_str and ehr_referenced_at_str:
+        try:
+            finalized_at = parse_utc_timestamp(finalized_at_str)
+            ehr_referenced_at = parse_utc_timestamp(ehr_referenced_at_str)
+
+            if finalized_at > ehr_referenced_at:
+                debug_info = {
+                    "finalized_at": finalized_at_str,
+                    "ehr_referenced_at": ehr_referenced_at_str,
+                }
+                failures.append(
+                    fail("timing", "finalized_after_ehr_reference", debug_info)
+                )
+        except Exception as e:
+            failures.append(fail("timing", "timestamp_parse_error", exception_debug(e)))
+
+    # Verify chain hash
+    try:
+        # Recompute chain hash from certificate fields
+        certificate_data = {
+            "certificate_id": certificate["certificate_id"],
+            "tenant_id": certificate["tenant_id"],
+            "timestamp": certificate["timestamp"],
+            "note_hash": certificate["note_hash"],
+            "model_version": certificate["model_version"],
+            "governance_policy_version": certificate["governance_policy_version"],
+        }
+
+        previous_hash = certificate["integrity_chain"]["previous_hash"]
+        recomputed_chain_hash = compute_chain_hash(certificate_data, previous_hash)
+        stored_chain_hash = certificate["integrity_chain"]["chain_hash"]
+
+        if not hashes_match(stored_chain_hash, recomputed_chain_hash):
+            debug_info = hash_prefix_debug(stored_chain_hash, recomputed_chain_hash)
+            failures.append(fail("integrity_chain", "chain_hash_mismatch", debug_info))
+    except Exception as e:
+        failures.append(
+            fail(
+                "integrity_chain",
+                "recomputation_failed",
+                exception_debug(e),
+            )
+        )
+
+    # Verify signature using per-tenant key
+    signature_bundle = certificate.get("signature", {})
+    key_id = signature_bundle.get("key_id")
+
+    if not key_id:
+        failures.append(fail("signature", "missing_key_id"))
+    else:
+        # Look up key from tenant key registry
+        registry = get_key_registry()
+        key_data = registry.get_key_by_id(tenant_id, key_id)
+
+        if not key_data:
+            # No fallback - per-tenant keys are required for security
+            # Cross-tenant key usage would be a critical security vulnerability
+            failures.append(fail("signature", "key_not_found"))
+            jwk = None
+        else:
+            jwk = key_data.get("public_jwk")
+
+        if jwk:
+            try:
+                # Reconstruct canonical message for verification
+                # Check if this is a new-style signature (with nonce/timestamp)
+                canonical_message = signature_bundle.get("canonical_message")
+
+                if not canonical_message:
+                    # Legacy format: reconstruct from certificate fields
+                    canonical_message = {
+                        "certificate_id": certificate["certificate_id"],
+                        "tenant_id": certificate["tenant_id"],
+                        "timestamp": certificate["timestamp"],
+                        "chain_hash": certificate["integrity_chain"]["chain_hash"],
+                        "note_hash": certificate["note_hash"],
+                        "governance_policy_version": certificate[
+                            "governance_policy_version"
+                        ],
+                    }
+
+                # Build signature bundle for verification
+                sig_bundle = {
+                    "key_id": signature_bundle["key_id"],
+                    "algorithm": signature_bundle["algorithm"],
+                    "signature": signature_bundle["signature"],
+                    "canonical_message": canonical_message,
+                }
+
+                signature_valid = verify_signature(sig_bundle, jwk)
+                if not signature_valid:
+                    failures.append(fail("signature", "invalid_signature"))
+            except Exception as e:
+                failures.append(
+                    fail(
+                        "signature",
+                        "verification_failed",
+                        exception_debug(e),
+                    )
+                )
+
+    valid = len(failures) == 0
+
+    # Generate human-friendly interpretation
+    human_friendly_report = interpret_verification(
+        failures=failures,
+        valid=valid,
+        certificate_id=certificate_id,
+        timestamp=certificate.get("timestamp"),
+    )
+
+    return {
+        "certificate_id": certificate_id,
+        "valid": valid,
+        "failures": failures,
+        "human_friendly_report": human_friendly_report,
+    }
 
 
 @router.post("/clinical/documentation", response_model=CertificateIssuanceResponse)
@@ -506,142 +661,115 @@ async def verify_certificate(
     finally:
         conn.close()
 
-    failures = []
+    return verify_certificate_record(certificate_id, certificate, tenant_id)
 
-    # Verify timing integrity
-    finalized_at_str = certificate.get("finalized_at")
-    ehr_referenced_at_str = certificate.get("ehr_referenced_at")
 
-    if finalized_at_str and ehr_referenced_at_str:
-        try:
-            from datetime import datetime
-
-            finalized_at = datetime.fromisoformat(
-                finalized_at_str.replace("Z", "+00:00")
-            )
-            ehr_referenced_at = datetime.fromisoformat(
-                ehr_referenced_at_str.replace("Z", "+00:00")
-            )
-
-            if finalized_at > ehr_referenced_at:
-                debug_info = {
-                    "finalized_at": finalized_at_str,
-                    "ehr_referenced_at": ehr_referenced_at_str,
-                }
-                failures.append(
-                    fail("timing", "finalized_after_ehr_reference", debug_info)
-                )
-        except Exception as e:
-            failures.append(
-                fail("timing", "timestamp_parse_error", {"exception": type(e).__name__})
-            )
+async def record_batch_rate_limit_cost(request: Request) -> None:
+    """
+    Record the batch size so the rate limit charges one hit per certificate.
 
-    # Verify chain hash
+    Runs as a route dependency, before the limiter checks the request; the
+    request body is already cached by FastAPI at that point. A malformed body
+    costs 1 and is then rejected by request validation.
+    """
     try:
-        # Recompute chain hash from certificate fields
-        certificate_data = {
-            "certificate_id": certificate["certificate_id"],
-            "tenant_id": certificate["tenant_id"],
-            "timestamp": certificate["timestamp"],
-            "note_hash": certificate["note_hash"],
-            "model_version": certificate["model_version"],
-            "governance_policy_version": certificate["governance_policy_version"],
-        }
+        certificate_ids = (await request.json()).get("certificate_ids")
+    except (ValueError, AttributeError):
+        certificate_ids = None
+    request.state.rate_limit_cost = (
+        len(certificate_ids) if isinstance(certificate_ids, list) else 1
+    )
 
-        previous_hash = certificate["integrity_chain"]["previous_hash"]
-        recomputed_chain_hash = compute_chain_hash(certificate_data, previous_hash)
-        stored_chain_hash = certificate["integrity_chain"]["chain_hash"]
 
-        if recomputed_chain_hash != stored_chain_hash:
-            debug_info = None
-            if recomputed_chain_hash and stored_chain_hash:
-                debug_info = {
-                    "stored_prefix": stored_chain_hash[:16],
-                    "recomputed_prefix": recomputed_chain_hash[:16],
-                }
-            failures.append(fail("integrity_chain", "chain_hash_mismatch", debug_info))
-    except Exception as e:
-        failures.append(
-            fail(
-                "integrity_chain",
-                "recomputation_failed",
-                {"exception": type(e).__name__},
-            )
-        )
+@router.post(
+    "/certificates/verify-batch",
+    dependencies=[Depends(record_batch_rate_limit_cost)],
+)
+# Rate limit: 100 certificate verifications per minute, charged per
+# certificate, so a batch costs the same as that many calls to the
+# single-certificate route (100/minute)
+@limiter.limit("100/minute", cost=lambda request: request.state.rate_limit_cost)
+def verify_certificates_batch(
+    request: Request,  # Required for rate limiting
+    req_body: CertificateBatchVerifyRequest,
+    identity: Identity = Depends(require_role("auditor")),
+) -> Dict[str, Any]:
+    """
+    Verify the cryptographic integrity of several certificates at once.
 
-    # Verify signature using per-tenant key
-    signature_bundle = certificate.get("signature", {})
-    key_id = signature_bundle.get("key_id")
+    SECURITY: Requires JWT authentication with 'auditor' role.
+    Enforces tenant isolation - certificates belonging to a different tenant
+    are reported exactly like missing ones.
 
-    if not key_id:
-        failures.append(fail("signature", "missing_key_id"))
-    else:
-        # Look up key from tenant key registry
-        registry = get_key_registry()
-        key_data = registry.get_key_by_id(tenant_id, key_id)
+    All requested certificates are loaded with a single query, then the
+    per-certificate checks (same as POST /v1/certificates/{id}/verify) run
+    concurrently on a thread pool.
 
-        if not key_data:
-            # No fallback - per-tenant keys are required for security
-            # Cross-tenant key usage would be a critical security vulnerability
-            failures.append(fail("signature", "key_not_found"))
-            jwk = None
-        else:
-            jwk = key_data.get("public_jwk")
+    Declared as a plain def so FastAPI runs it in its worker threadpool: the
+    batch blocks on up to 100 ECDSA checks and must not hold the event loop.
 
-        if jwk:
-            try:
-                # Reconstruct canonical message for verification
-                # Check if this is a new-style signature (with nonce/timestamp)
-                canonical_message = signature_bundle.get("canonical_message")
+    Args:
+        request: FastAPI request (for rate limiting)
+        req_body: Certificate identifiers to verify
+        identity: Authenticated identity (injected by JWT dependency)
 
-                if not canonical_message:
-                    # Legacy format: reconstruct from certificate fields
-                    canonical_message = {
-                        "certificate_id": certificate["certificate_id"],
-                        "tenant_id": certificate["tenant_id"],
-                        "timestamp": certificate["timestamp"],
-                        "chain_hash": certificate["integrity_chain"]["chain_hash"],
-                        "note_hash": certificate["note_hash"],
-                        "governance_policy_version": certificate[
-                            "governance_policy_version"
-                        ],
-                    }
+    Returns:
+        Dictionary with:
+        - total_count: Number of certificates requested
+        - valid_count: Number of certificates that verified
+        - results: Per-certificate verification results, in request order
+    """
+    import json
+    from gateway.app.db.migrate import get_connection
 
-                # Build signature bundle for verification
-                sig_bundle = {
-                    "key_id": signature_bundle["key_id"],
-                    "algorithm": signature_bundle["algorithm"],
-                    "signature": signature_bundle["signature"],
-                    "canonical_message": canonical_message,
-                }
+    # Use tenant_id from authenticated identity
+    tenant_id = identity.tenant_id
+    certificate_ids = req_body.certificate_ids
 
-                signature_valid = verify_signature(sig_bundle, jwk)
-                if not signature_valid:
-                    failures.append(fail("signature", "invalid_signature"))
-            except Exception as e:
-                failures.append(
-                    fail(
-                        "signature",
-                        "verification_failed",
-                        {"exception": type(e).__name__},
-                    )
-                )
+    # Load all requested certificates for this tenant in one query
+    placeholders = ",".join("?" for _ in certificate_ids)
+    conn = get_connection()
+    try:
+        cursor = conn.execute(
+            f"""
+            SELECT certificate_id, certificate_json
+            FROM certificates
+            WHERE tenant_id = ? AND certificate_id IN ({placeholders})
+        """,
+            [tenant_id, *certificate_ids],
+        )
+        certificates = {
+            row["certificate_id"]: json.loads(row["certificate_json"])
+            for row in cursor.fetchall()
+        }
+    finally:
+        conn.close()
 
-    valid = len(failures) == 0
+    def verify_one(certificate_id: str) -> Dict[str, Any]:
+        certificate = certificates.get(certificate_id)
+        if certificate is None:
+            # Don't reveal whether the certificate exists for another tenant
+            failures = [fail("certificate", "not_found")]
+            return {
+                "certificate_id": certificate_id,
+                "valid": False,
+                "failures": failures,
+                "human_friendly_report": interpret_verification(
+                    failures=failures,
+                    valid=False,
+                    certificate_id=certificate_id,
+                ),
+            }
+        return verify_certificate_record(certificate_id, certificate, tenant_id)
 
-    # Generate human-friendly interpretation
-    human_friendly_report = interpret_verification(
-        failures=failures,
-        valid=valid,
-        certificate_id=certificate_id,
-        timestamp=certificate.get("timestamp"),
-    )
+    workers = min(BATCH_VERIFY_MAX_WORKERS, len(certificate_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(verify_one, certificate_ids))
 
     return {
-        "certificate_id": certificate_id,
-        "valid": valid,
-        "failures": failures,
-        "human_friendly_report": human_friendly_report,
+        "total_count": len(results),
+        "valid_count": sum(1 for result in results if result["valid"]),
+        "results": results,
     }
 
 
@@ -7,7 +7,12 @@ from typing import Dict, Any
 
 from gateway.app.services.storage import get_transaction
 from gateway.app.services.signer import verify_signature
-from gateway.app.routes.verify_utils import fail
+from gateway.app.routes.verify_utils import (
+    exception_debug,
+    fail,
+    hash_prefix_debug,
+    hashes_match,
+)
 
 router = APIRouter(prefix="/v1/transactions", tags=["transactions"])
 
@@ -73,22 +78,15 @@ async def verify_transaction(transaction_id: str) -> Dict[str, Any]:
         stored_final_hash = packet.get("halo_chain", {}).get("final_hash")
         recomputed_final_hash = recomputed_halo.get("final_hash")
 
-        if stored_final_hash != recomputed_final_hash:
+        if not hashes_match(stored_final_hash, recomputed_final_hash):
             # Hash leakage policy: return error code + prefixes only (first 16 chars)
             # Use error code instead of full hash values (security best practice)
             # Include only hash prefixes for debugging without leaking full cryptographic material
-            debug_info = None
-            if stored_final_hash and recomputed_final_hash:
-                debug_info = {
-                    "stored_prefix": stored_final_hash[:16],
-                    "recomputed_prefix": recomputed_final_hash[:16],
-                }
+            debug_info = hash_prefix_debug(stored_final_hash, recomputed_final_hash)
             failures.append(fail("halo_chain", "final_hash_mismatch", debug_info))
     except Exception as e:
         # Debug policy: exception type only (no full message to prevent information leakage)
-        failures.append(
-            fail("halo_chain", "recomputation_failed", {"exception": type(e).__name__})
-        )
+        failures.append(fail("halo_chain", "recomputation_failed", exception_debug(e)))
 
     # Verify signature using key from packet's verification.key_id
     signature_bundle = packet.get("verification", {})
@@ -134,7 +132,7 @@ async def verify_transaction(transaction_id: str) -> Dict[str, Any]:
                     fail(
                         "signature",
                         "verification_failed",
-                        {"exception": type(e).__name__},
+                        exception_debug(e),
                     )
                 )
 
@@ -4,8 +4,12 @@ Verification utility functions.
 Provides helpers for consistent failure reporting in verification endpoints.
 """
 
+import hmac
 from typing import Dict, Any, Optional
 
+# Hash leakage policy: debug output carries at most this many leading characters
+HASH_PREFIX_LENGTH = 16
+
 
 def fail(
     check: str, error: str, debug: Optional[Dict[str, Any]] = None
@@ -37,3 +41,83 @@ def fail(
     if debug:
         out["debug"] = debug
     return out
+
+
+def exception_debug(exc: BaseException) -> Dict[str, str]:
+    """
+    Build the debug payload for an exception raised during verification.
+
+    Debug policy: only the exception class name is reported, never the
+    message, so field names and values cannot leak into responses.
+
+    Args:
+        exc: The caught exception
+
+    Returns:
+        Debug dictionary with the 'exception' type name
+
+    Examples:
+        >>> exception_debug(KeyError("policy_receipt"))
+        {'exception': 'KeyError'}
+    """
+    return {"exception": type(exc).__name__}
+
+
+def hashes_match(stored_hash: Optional[str], recomputed_hash: Optional[str]) -> bool:
+    """
+    Compare two hash strings in constant time.
+
+    Used wherever a verification decision branches on a hash comparison, so
+    the response time does not reveal how many leading characters matched.
+
+    Args:
+        stored_hash: Hash value stored with the record
+        recomputed_hash: Hash value recomputed during verification
+
+    Returns:
+        True only if both hashes are present strings with identical contents
+
+    Examples:
+        >>> hashes_match("sha256:abc", "sha256:abc")
+        True
+
+        >>> hashes_match("sha256:abc", None)
+        False
+    """
+    if not isinstance(stored_hash, str) or not isinstance(recomputed_hash, str):
+        return False
+    return hmac.compare_digest(
+        stored_hash.encode("utf-8"), recomputed_hash.encode("utf-8")
+    )
+
+
+def hash_prefix_debug(
+    stored_hash: Optional[str], recomputed_hash: Optional[str]
+) -> Optional[Dict[str, str]]:
+    """
+    Build the prefix-only debug payload for a hash mismatch.
+
+    Each hash is sliced exactly once to HASH_PREFIX_LENGTH characters, so the
+    full hash values never reach the response.
+
+    Args:
+        stored_hash: Hash value stored with the record
+        recomputed_hash: Hash value recomputed during verification
+
+    Returns:
+        Debug dictionary with 'stored_prefix' and 'recomputed_prefix',
+        or None if either hash is missing
+
+    Examples:
+        >>> hash_prefix_debug("sha256:0123456789abcdef", "sha256:fedcba9876543210")
+        {'stored_prefix': 'sha256:012345678', 'recomputed_prefix': 'sha256:fedcba987'}
+
+        >>> hash_prefix_debug(None, "sha256:fedcba9876543210") is None
+        True
+    """
+    if not stored_hash or not recomputed_hash:
+        return None
+    return {
+        "stored_prefix": stored_hash[:HASH_PREFIX_LENGTH],
+        "recomputed_prefix": recomputed_hash[:HASH_PREFIX_LENGTH],
+    }
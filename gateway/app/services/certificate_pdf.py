@@ -13,7 +13,8 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 from io import BytesIO
 from typing import Dict, Any
-from datetime import datetime
+
+from gateway.app.services.timestamps import parse_utc_timestamp
 
 
 def generate_certificate_pdf(certificate: Dict[str, Any], valid: bool = None) -> bytes:
@@ -258,7 +259,7 @@ def _format_timestamp(ts: str) -> str:
     if not ts:
         return "N/A"
     try:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        dt = parse_utc_timestamp(ts)
         return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
     except Exception:
         return ts
@@ -45,7 +45,7 @@ def sha256_prefixed(data: bytes) -> str:
         >>> sha256_prefixed(b"hello")
         'sha256:2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824'
     """
-    return f"sha256:{sha256_hex(data)}"
+    return "sha256:" + sha256_hex(data)
 
 
 def hash_c14n(obj: Any) -> str:
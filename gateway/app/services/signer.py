@@ -19,6 +19,7 @@ Signature Format:
 import base64
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 from cryptography.hazmat.primitives import hashes, serialization
@@ -29,6 +30,23 @@ from gateway.app.services.c14n import json_c14n_v1
 from gateway.app.services.key_registry import get_key_registry
 from gateway.app.db.migrate import get_connection
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Signature algorithm parameters are immutable, so build them once per process
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
+# Key prefixes of the locked 4-field signing message, in canonical (sorted) order.
+# Emitting these directly avoids re-sorting the keys on every sign/verify.
+_SIGNING_MESSAGE_FIELDS = (
+    (b'{"final_hash":', "final_hash"),
+    (b',"gateway_timestamp_utc":', "gateway_timestamp_utc"),
+    (b',"policy_version_hash":', "policy_version_hash"),
+    (b',"transaction_id":', "transaction_id"),
+)
+
 
 def _load_private_key():
     """
@@ -56,30 +74,70 @@ def _load_public_jwk():
         return json.load(f)
 
 
-def _jwk_to_public_key(jwk: Dict[str, str]):
-    """Convert JWK to cryptography public key object."""
-    if jwk["kty"] != "EC" or jwk["crv"] != "P-256":
-        raise ValueError("Only EC P-256 keys are supported")
+def _base64url_decode(s: str) -> bytes:
+    """Decode unpadded base64url (as used in JWK coordinates)."""
+    # Add padding if needed
+    padding = 4 - (len(s) % 4)
+    if padding != 4:
+        s = s + ("=" * padding)
+    return base64.urlsafe_b64decode(s)
 
-    # Decode base64url coordinates
-    def base64url_decode(s):
-        # Add padding if needed
-        padding = 4 - (len(s) % 4)
-        if padding != 4:
-            s = s + ("=" * padding)
-        return base64.urlsafe_b64decode(s)
 
-    x_bytes = base64url_decode(jwk["x"])
-    y_bytes = base64url_decode(jwk["y"])
+@lru_cache(maxsize=256)
+def _ec_p256_public_key(x_b64: str, y_b64: str) -> ec.EllipticCurvePublicKey:
+    """
+    Build a P-256 public key from base64url coordinates.
 
-    x = int.from_bytes(x_bytes, byteorder="big")
-    y = int.from_bytes(y_bytes, byteorder="big")
+    Cached per coordinate pair: point decoding and on-curve validation are the
+    most expensive part of verification after the ECDSA check itself, and the
+    same tenant keys are used for every certificate they sign.
+    """
+    x = int.from_bytes(_base64url_decode(x_b64), byteorder="big")
+    y = int.from_bytes(_base64url_decode(y_b64), byteorder="big")
 
     # Reconstruct public key
     public_numbers = ec.EllipticCurvePublicNumbers(x, y, ec.SECP256R1())
     return public_numbers.public_key()
 
 
+def _jwk_to_public_key(jwk: Dict[str, str]) -> ec.EllipticCurvePublicKey:
+    """Convert JWK to cryptography public key object."""
+    if jwk["kty"] != "EC" or jwk["crv"] != "P-256":
+        raise ValueError("Only EC P-256 keys are supported")
+
+    return _ec_p256_public_key(jwk["x"], jwk["y"])
+
+
+def _canonicalize_value(value: Any) -> bytes:
+    """Canonicalize a single message value, using orjson for plain strings."""
+    if orjson is not None and type(value) is str:
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates: let json_c14n_v1 raise its usual error
+    return json_c14n_v1(value)
+
+
+def _canonicalize_signing_message(message_obj: Dict[str, Any]) -> bytes:
+    """
+    Canonicalize the locked 4-field signing message.
+
+    Produces exactly the same bytes as json_c14n_v1(message_obj), but emits the
+    fixed key layout directly instead of sorting keys on every call. String
+    values are serialized with orjson when available (its string escaping is
+    identical to json_c14n_v1); everything else goes through json_c14n_v1.
+
+    Callers must have already checked that message_obj contains exactly the
+    canonical fields.
+    """
+    parts = []
+    for key_prefix, field in _SIGNING_MESSAGE_FIELDS:
+        parts.append(key_prefix)
+        parts.append(_canonicalize_value(message_obj[field]))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
 def check_and_record_nonce(tenant_id: str, nonce: str) -> bool:
     """
     Check if nonce has been used and record it if not.
@@ -161,14 +219,14 @@ def sign_message(message_obj: Dict[str, Any]) -> Dict[str, Any]:
             f"Got: {message_fields}"
         )
 
-    # Canonicalize the message
-    canonical_bytes = json_c14n_v1(message_obj)
+    # Canonicalize the message (fixed 4-field layout)
+    canonical_bytes = _canonicalize_signing_message(message_obj)
 
     # Load private key
     private_key = _load_private_key()
 
     # Sign the canonical bytes
-    signature = private_key.sign(canonical_bytes, ec.ECDSA(hashes.SHA256()))
+    signature = private_key.sign(canonical_bytes, _ECDSA_SHA256)
 
     # Encode signature as base64
     signature_b64 = base64.b64encode(signature).decode("utf-8")
@@ -247,7 +305,7 @@ def sign_generic_message(message_obj: Dict[str, Any], tenant_id: str) -> Dict[st
 
     # Sign with tenant's key
     private_key = key_data["private_key"]
-    signature = private_key.sign(canonical_bytes, ec.ECDSA(hashes.SHA256()))
+    signature = private_key.sign(canonical_bytes, _ECDSA_SHA256)
 
     # Encode signature as base64
     signature_b64 = base64.b64encode(signature).decode("utf-8")
@@ -296,7 +354,7 @@ def verify_signature(bundle: Dict[str, Any], jwk: Dict[str, str]) -> bool:
         public_key = _jwk_to_public_key(jwk)
 
         # Verify signature
-        public_key.verify(signature, canonical_bytes, ec.ECDSA(hashes.SHA256()))
+        public_key.verify(signature, canonical_bytes, _ECDSA_SHA256)
 
         return True
 
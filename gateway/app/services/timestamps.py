@@ -0,0 +1,29 @@
+"""
+UTC timestamp helpers.
+
+CDIL stores timestamps as ISO 8601 strings with a trailing 'Z'
+(e.g. '2024-01-15T10:30:00.123456Z'). These helpers parse that format
+into timezone-aware datetimes.
+"""
+
+from datetime import datetime
+
+
+def parse_utc_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Args:
+        value: ISO 8601 timestamp string
+
+    Returns:
+        Parsed datetime (timezone-aware when the string carries an offset)
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp
+
+    Example:
+        >>> parse_utc_timestamp("2024-01-15T10:30:00Z")
+        datetime.datetime(2024, 1, 15, 10, 30, tzinfo=datetime.timezone.utc)
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
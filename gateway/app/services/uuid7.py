@@ -3,12 +3,58 @@ UUIDv7 generator implementation.
 
 UUIDv7 embeds a timestamp in the first 48 bits for natural time-based ordering.
 This is more appropriate for transaction IDs than random UUIDv4.
+
+IDs generated by one process are strictly increasing: within the same
+millisecond the 12-bit rand_a field is used as a counter (RFC 9562,
+Section 6.2, Method 1). Random bits are drawn from a buffered os.urandom
+pool so that most calls do not need a syscall.
 """
 
-import time
 import os
+import threading
+import time
 import uuid
 
+# Size of the os.urandom pool (each UUID consumes 8 bytes)
+_RANDOM_POOL_SIZE = 4096
+
+# rand_a counter is 12 bits; new milliseconds start below half its range so
+# there is headroom for increments before the counter overflows
+_COUNTER_MAX = 0xFFF
+_COUNTER_SEED_MASK = 0x7FF
+
+_RAND_B_MASK = (1 << 62) - 1
+
+_lock = threading.Lock()
+_random_pool = b""
+_random_offset = 0
+_last_timestamp_ms = -1
+_counter = 0
+
+
+def _reset_state() -> None:
+    """Discard generator state (called in forked children so pools aren't shared)."""
+    global _random_pool, _random_offset, _last_timestamp_ms, _counter
+    _random_pool = b""
+    _random_offset = 0
+    _last_timestamp_ms = -1
+    _counter = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_state)
+
+
+def _take_random(n: int) -> int:
+    """Take n bytes from the random pool as an int. Caller must hold _lock."""
+    global _random_pool, _random_offset
+    if _random_offset + n > len(_random_pool):
+        _random_pool = os.urandom(_RANDOM_POOL_SIZE)
+        _random_offset = 0
+    start = _random_offset
+    _random_offset += n
+    return int.from_bytes(_random_pool[start : start + n], byteorder="big")
+
 
 def generate_uuid7() -> str:
     """
@@ -17,38 +63,40 @@ def generate_uuid7() -> str:
     Format (RFC 9562):
     - Bits 0-47: Unix timestamp in milliseconds (48 bits)
     - Bits 48-51: Version = 7 (0111)
-    - Bits 52-53: Variant = RFC4122 (10)
-    - Bits 54-127: Random data (74 bits)
+    - Bits 52-63: rand_a, used as a monotonic counter within a millisecond
+    - Bits 64-65: Variant = RFC4122 (10)
+    - Bits 66-127: Random data (62 bits)
 
     Returns:
         String representation of UUIDv7
     """
-    # Get current timestamp in milliseconds
-    timestamp_ms = int(time.time() * 1000)
-
-    # Extract 48 bits of timestamp
-    timestamp_48 = timestamp_ms & 0xFFFFFFFFFFFF
-
-    # Generate random bytes for the rest
-    random_bytes = os.urandom(10)  # 80 bits of random data
+    global _last_timestamp_ms, _counter
 
-    # Build the UUID bytes
-    # Bytes 0-5: timestamp (48 bits)
-    uuid_bytes = bytearray()
-    uuid_bytes.extend(timestamp_48.to_bytes(6, byteorder="big"))
+    timestamp_ms = time.time_ns() // 1_000_000
 
-    # Bytes 6-7: version and random (16 bits)
-    # Take first 2 bytes of random, set version to 7 (0111 in high nibble of byte 6)
-    uuid_bytes.extend(random_bytes[0:2])
-    uuid_bytes[6] = (uuid_bytes[6] & 0x0F) | 0x70  # Set version to 7
+    with _lock:
+        if timestamp_ms > _last_timestamp_ms:
+            # New millisecond: reseed the counter randomly
+            _last_timestamp_ms = timestamp_ms
+            _counter = _take_random(2) & _COUNTER_SEED_MASK
+        else:
+            # Same millisecond (or clock moved backwards): keep ordering by
+            # incrementing the counter, borrowing the next millisecond on overflow
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_timestamp_ms += 1
+                _counter = _take_random(2) & _COUNTER_SEED_MASK
 
-    # Bytes 8-9: variant and random (16 bits)
-    # Set variant to 10 (RFC4122)
-    uuid_bytes.extend(random_bytes[2:4])
-    uuid_bytes[8] = (uuid_bytes[8] & 0x3F) | 0x80  # Set variant to 10
+        timestamp_48 = _last_timestamp_ms & 0xFFFFFFFFFFFF
+        counter = _counter
+        rand_b = _take_random(8) & _RAND_B_MASK
 
-    # Bytes 10-15: random (48 bits)
-    uuid_bytes.extend(random_bytes[4:10])
+    value = (
+        (timestamp_48 << 80)
+        | (0x7 << 76)  # Version 7
+        | (counter << 64)
+        | (0b10 << 62)  # Variant 10 (RFC4122)
+        | rand_b
+    )
 
-    # Convert to UUID object to get proper string formatting
-    return str(uuid.UUID(bytes=bytes(uuid_bytes)))
+    return str(uuid.UUID(int=value))
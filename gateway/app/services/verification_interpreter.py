@@ -241,6 +241,11 @@ def _interpret_failure(
             "explanation": "The certificate does not contain governance policy information.",
             "action": "Cannot verify compliance. Obtain policy documentation.",
         },
+        ("certificate", "not_found"): {
+            "meaning": "Certificate not found",
+            "explanation": "No certificate with this identifier is available to your organization. It may not exist or may belong to a different organization.",
+            "action": "Check the certificate identifier, or contact the issuing organization.",
+        },
         ("tenant", "tenant_mismatch"): {
             "meaning": "Wrong tenant; access denied",
             "explanation": "The certificate belongs to a different organization. You do not have permission to access this certificate.",
@@ -10,13 +10,45 @@ pytest's collection phase.
 """
 
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
 
 # Set ENV=TEST to disable rate limiting BEFORE any modules are imported
 # This happens during pytest's initial import phase, before test collection
 os.environ["ENV"] = "TEST"
 os.environ["DISABLE_RATE_LIMITS"] = "1"
 
-import pytest
+# Prefer tmpfs for per-test databases so SQLite commits never wait on disk
+TEST_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Under pytest-xdist, give each worker its own default SQLite database so
+# parallel workers never race on migrations or share rows. The database lives
+# in a fresh directory (removed in pytest_sessionfinish), so no run ever sees
+# a previous run's rows or schema.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_WORKER_DB_DIR = None
+if _XDIST_WORKER and not os.environ.get("CDIL_DB_PATH"):
+    _WORKER_DB_DIR = tempfile.mkdtemp(
+        prefix=f"cdil-test-{_XDIST_WORKER}-", dir=TEST_TEMP_ROOT
+    )
+    os.environ["CDIL_DB_PATH"] = os.path.join(_WORKER_DB_DIR, "cdil.db")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove this worker's default database directory."""
+    if _WORKER_DB_DIR is not None:
+        shutil.rmtree(_WORKER_DB_DIR, ignore_errors=True)
+
+
+def pytest_report_header(config):
+    """Show the OpenSSL build the ssl module links."""
+    import ssl
+
+    return f"OpenSSL (ssl): {ssl.OPENSSL_VERSION}"
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -30,3 +62,29 @@ def setup_test_database():
     from gateway.app.db.migrate import ensure_schema
 
     ensure_schema()
+
+
+@contextmanager
+def _temp_db_dir():
+    with tempfile.TemporaryDirectory(
+        dir=TEST_TEMP_ROOT, ignore_cleanup_errors=True
+    ) as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture
+def temp_db_dir():
+    """Per-test temporary directory for SQLite databases.
+
+    Lives on tmpfs (/dev/shm) when available and is removed by
+    TemporaryDirectory when the test finishes.
+    """
+    with _temp_db_dir() as temp_dir:
+        yield temp_dir
+
+
+@pytest.fixture(scope="module")
+def module_temp_db_dir():
+    """Like temp_db_dir, but shared by all tests in a module."""
+    with _temp_db_dir() as temp_dir:
+        yield temp_dir
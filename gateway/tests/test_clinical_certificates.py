@@ -485,3 +485,25 @@ def test_canonical_message_signed_fields_contract(client):
         f"Canonical message contains unexpected extra fields: {extra}. "
         "Update docs/BUNDLE_SPEC.md and docs/CONTRACT_SNAPSHOT.md if intentional."
     )
+
+
+def test_compute_chain_hash_is_unprefixed_c14n_hash():
+    """Test that chain hashes equal the unprefixed SHA-256 of the canonical payload."""
+    from gateway.app.routes.clinical import compute_chain_hash
+    from gateway.app.services.hashing import hash_c14n
+
+    certificate_data = {
+        "certificate_id": "cert-001",
+        "tenant_id": "hospital-alpha",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "note_hash": "a" * 64,
+        "model_version": "gpt-4-turbo",
+        "governance_policy_version": "CDOC-Policy-v1",
+    }
+
+    for previous_hash in (None, "b" * 64):
+        expected = hash_c14n({"previous_hash": previous_hash, **certificate_data})
+        chain_hash = compute_chain_hash(certificate_data, previous_hash)
+
+        assert len(chain_hash) == 64
+        assert "sha256:" + chain_hash == expected
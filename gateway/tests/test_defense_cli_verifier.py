@@ -47,7 +47,7 @@ def client(test_db):
     return TestClient(app)
 
 
-def issue_and_get_defense_bundle(client, tenant_id="hospital-alpha"):
+def issue_and_get_defense_bundle(client, tenant_id="hospital-alpha", **overrides):
     """Helper to issue certificate and get defense bundle."""
     # Issue certificate
     request_data = {
@@ -59,6 +59,7 @@ def issue_and_get_defense_bundle(client, tenant_id="hospital-alpha"):
         "human_reviewed": True,
         "human_reviewer_id": "DR-TEST-001",
         "encounter_id": "ENC-TEST-001",
+        **overrides,
     }
 
     headers = create_clinician_headers(tenant_id)
@@ -110,6 +111,31 @@ def test_cli_verifier_passes_valid_bundle(client):
         Path(temp_path).unlink(missing_ok=True)
 
 
+def test_cli_verifier_passes_non_ascii_bundle(client):
+    """
+    Test that non-ASCII provenance fields verify (signed as raw UTF-8).
+    """
+    bundle_bytes = issue_and_get_defense_bundle(client, model_name="modèle-clinique")
+
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=".zip", delete=False) as f:
+        temp_path = f.name
+        f.write(bundle_bytes)
+
+    try:
+        result = subprocess.run(
+            ["python3", "tools/verify_bundle.py", temp_path],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent.parent,  # Project root
+        )
+
+        assert result.returncode == 0, result.stdout
+        assert "SIGNATURE VALID" in result.stdout
+
+    finally:
+        Path(temp_path).unlink(missing_ok=True)
+
+
 def test_cli_verifier_detects_tampered_bundle(client):
     """
     Test that CLI verifier returns exit code 1 for tampered bundle.
@@ -223,6 +249,35 @@ def test_cli_verifier_shows_usage_without_args():
     assert "Usage" in result.stdout or "usage" in result.stdout.lower()
 
 
+def test_cli_verifier_batch_dir(client):
+    """
+    Test that --dir verifies every bundle and reports the worst exit code.
+    """
+    bundle_bytes = issue_and_get_defense_bundle(client)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "a_valid.zip").write_bytes(bundle_bytes)
+        (Path(tmpdir) / "b_valid.zip").write_bytes(bundle_bytes)
+        (Path(tmpdir) / "c_broken.zip").write_text("NOT A VALID ZIP FILE")
+
+        result = subprocess.run(
+            ["python3", "tools/verify_bundle.py", "--dir", tmpdir],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent.parent,
+        )
+
+        assert result.returncode == 2
+        assert "PASS   a_valid.zip" in result.stdout
+        assert "PASS   b_valid.zip" in result.stdout
+        assert "ERROR  c_broken.zip" in result.stdout
+        assert "Passed: 2" in result.stdout
+        assert "Errors: 1" in result.stdout
+
+        # Per-bundle step reports are not printed in batch mode
+        assert "STEP 1" not in result.stdout
+
+
 def test_cli_verifier_output_has_verification_steps(client):
     """
     Test that CLI verifier output shows all verification steps.
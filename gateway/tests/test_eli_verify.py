@@ -0,0 +1,243 @@
+"""
+Tests for the ELI Sentinel offline verifier (tools/eli_verify.py).
+
+Tests:
+- Opt-in report cache: hits, isolation, per-JWK keys and eviction
+- --packet-dir batch mode: worst exit code, failure-only JSON lines,
+  load errors and empty directories
+"""
+
+import copy
+import json
+import subprocess
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from gateway.app.services.halo import build_halo_chain
+from gateway.app.services.signer import sign_message
+from tools import eli_verify
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+DEV_JWK_PATH = REPO_ROOT / "gateway" / "app" / "dev_keys" / "dev_public.jwk.json"
+
+
+def _build_packet(transaction_id: str = "tx-eli-001") -> dict:
+    """Build a HALO chain and sign it with the dev key, as the gateway does."""
+    halo = build_halo_chain(
+        transaction_id=transaction_id,
+        gateway_timestamp_utc="2024-01-15T10:30:00.000Z",
+        environment="production",
+        client_id="client-test-01",
+        intent_manifest="text-generation",
+        feature_tag="test-feature",
+        user_ref="user-123",
+        prompt_hash="sha256:prompt123",
+        rag_hash=None,
+        multimodal_hash=None,
+        policy_version_hash="sha256:policy123",
+        policy_change_ref="change-001",
+        rules_applied=["rule1"],
+        model_fingerprint="gpt-4",
+        param_snapshot={"temperature": 0.7},
+        execution={"outcome": "approved", "output_hash": "sha256:output123"},
+    )
+    signature = sign_message(
+        {
+            "transaction_id": transaction_id,
+            "gateway_timestamp_utc": "2024-01-15T10:30:00.000Z",
+            "final_hash": halo["final_hash"],
+            "policy_version_hash": "sha256:policy123",
+        }
+    )
+    return {"halo": halo, "signature": signature}
+
+
+@pytest.fixture(scope="module")
+def packet():
+    return _build_packet()
+
+
+@pytest.fixture(scope="module")
+def jwk():
+    return json.loads(DEV_JWK_PATH.read_text())
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Give each test an empty report cache and count full verifications."""
+    cache = OrderedDict()
+    monkeypatch.setattr(eli_verify, "_verify_cache", cache)
+    calls = []
+    original = eli_verify._verify_packet
+
+    def counting_verify(packet, jwk):
+        calls.append(packet)
+        return original(packet, jwk)
+
+    monkeypatch.setattr(eli_verify, "_verify_packet", counting_verify)
+    return cache, calls
+
+
+def _halo_tampered(packet: dict) -> dict:
+    tampered = copy.deepcopy(packet)
+    tampered["halo"]["blocks"][0]["client_id"] = "client-evil"
+    return tampered
+
+
+def _signature_tampered(packet: dict) -> dict:
+    tampered = copy.deepcopy(packet)
+    tampered["signature"]["message"]["transaction_id"] = "tx-forged"
+    return tampered
+
+
+def test_verify_packet_valid(packet, jwk):
+    """A freshly signed packet passes every check and maps to exit code 0."""
+    report = eli_verify.verify_packet(packet, jwk)
+
+    assert report["overall_valid"] is True
+    assert report["signature_valid"] is True
+    assert eli_verify.report_exit_code(report) == 0
+
+
+def test_verify_packet_cache_hit_returns_independent_copy(packet, jwk, fresh_cache):
+    """A cache hit returns an equal report that callers can't mutate the cache through."""
+    cache, calls = fresh_cache
+
+    first = eli_verify.verify_packet(packet, jwk, use_cache=True)
+    expected = copy.deepcopy(first)
+    first["errors"].append("mutated by caller")
+
+    second = eli_verify.verify_packet(packet, jwk, use_cache=True)
+    second["warnings"].append("mutated by caller")
+    third = eli_verify.verify_packet(packet, jwk, use_cache=True)
+
+    assert len(calls) == 1
+    assert len(cache) == 1
+    assert second is not first
+    assert third == expected
+
+
+def test_verify_packet_cache_keys_on_jwk(packet, jwk, fresh_cache):
+    """The same packet under a different JWK gets its own cache entry."""
+    cache, calls = fresh_cache
+    other_jwk = {**jwk, "kid": "other-key"}
+
+    with_key = eli_verify.verify_packet(packet, jwk, use_cache=True)
+    with_other_key = eli_verify.verify_packet(packet, other_jwk, use_cache=True)
+    without_key = eli_verify.verify_packet(packet, None, use_cache=True)
+
+    assert len(calls) == 3
+    assert len(cache) == 3
+    assert with_key["signature_valid"] is True
+    assert with_other_key["signature_valid"] is True
+    assert without_key["signature_valid"] is None
+
+
+def test_verify_packet_cache_evicts_least_recently_used(jwk, fresh_cache, monkeypatch):
+    """The cache holds at most _VERIFY_CACHE_SIZE reports, dropping the oldest."""
+    cache, calls = fresh_cache
+    monkeypatch.setattr(eli_verify, "_VERIFY_CACHE_SIZE", 2)
+    a, b, c = (_build_packet(f"tx-eli-{n}") for n in "abc")
+
+    eli_verify.verify_packet(a, jwk, use_cache=True)
+    eli_verify.verify_packet(b, jwk, use_cache=True)
+    eli_verify.verify_packet(a, jwk, use_cache=True)  # a is now most recent
+    eli_verify.verify_packet(c, jwk, use_cache=True)  # evicts b
+    assert len(cache) == 2
+    assert len(calls) == 3
+
+    eli_verify.verify_packet(a, jwk, use_cache=True)
+    assert len(calls) == 3
+    eli_verify.verify_packet(b, jwk, use_cache=True)
+    assert len(calls) == 4
+
+
+def test_verify_packet_dir_reports_worst_exit_code(packet, jwk, tmp_path, capsys):
+    """Batch mode prints one JSON line per failure and returns the highest code."""
+    (tmp_path / "a_valid.json").write_text(json.dumps(packet))
+    (tmp_path / "b_halo.json").write_text(json.dumps(_halo_tampered(packet)))
+    (tmp_path / "c_signature.json").write_text(json.dumps(_signature_tampered(packet)))
+
+    assert eli_verify.verify_packet_dir(str(tmp_path), jwk) == 3
+
+    lines = capsys.readouterr().out.splitlines()
+    failures = [json.loads(line) for line in lines[:-1]]
+    assert {Path(f["packet"]).name: f["exit_code"] for f in failures} == {
+        "b_halo.json": 2,
+        "c_signature.json": 3,
+    }
+    assert lines[-1] == "Verified 3 packets: 1 passed, 2 failed"
+
+
+def test_verify_packet_dir_load_error_is_schema_invalid(packet, jwk, tmp_path, capsys):
+    """A packet file that can't be parsed counts as exit code 10."""
+    (tmp_path / "a_valid.json").write_text(json.dumps(packet))
+    (tmp_path / "b_broken.json").write_text("NOT JSON")
+
+    assert eli_verify.verify_packet_dir(str(tmp_path), jwk) == 10
+
+    failure_line, summary = capsys.readouterr().out.splitlines()
+    failure = json.loads(failure_line)
+    assert Path(failure["packet"]).name == "b_broken.json"
+    assert failure["exit_code"] == 10
+    assert failure["report"]["errors"][0].startswith("Error loading packet:")
+    assert summary == "Verified 2 packets: 1 passed, 1 failed"
+
+
+def test_verify_packet_dir_empty_directory(tmp_path, capsys):
+    """An empty directory is an error rather than a vacuous pass."""
+    (tmp_path / "notes.txt").write_text("not a packet")
+
+    assert eli_verify.verify_packet_dir(str(tmp_path)) == 1
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "No packet files (*.json)" in captured.err
+
+
+def test_cli_packet_dir(packet, tmp_path):
+    """Smoke test: --packet-dir runs end to end and exits with the worst code."""
+    (tmp_path / "a_valid.json").write_text(json.dumps(packet))
+    (tmp_path / "b_valid.json").write_text(json.dumps(packet))
+    (tmp_path / "c_halo.json").write_text(json.dumps(_halo_tampered(packet)))
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "tools/eli_verify.py",
+            "--packet-dir",
+            str(tmp_path),
+            "--jwk",
+            str(DEV_JWK_PATH),
+        ],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+
+    assert result.returncode == 2
+    assert "c_halo.json" in result.stdout
+    assert "a_valid.json" not in result.stdout
+    assert "Verified 3 packets: 2 passed, 1 failed" in result.stdout
+
+
+def test_cli_packet_dir_rejects_json(tmp_path):
+    """--json only applies to --packet; batch output is always JSON lines."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "tools/eli_verify.py",
+            "--packet-dir",
+            str(tmp_path),
+            "--json",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+
+    assert result.returncode == 2
+    assert "--json cannot be used with --packet-dir" in result.stderr
@@ -208,3 +208,48 @@ def test_canonical_message_contract_enforced():
     # Should raise ValueError
     with pytest.raises(ValueError, match="Message must contain exactly these fields"):
         sign_message(invalid_message_missing)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_signing_message_canonicalization_matches_c14n(use_orjson, monkeypatch):
+    """Test that the fixed-layout canonicalizer matches json_c14n_v1 byte-for-byte."""
+    import gateway.app.services.signer as signer_module
+    from gateway.app.services.c14n import json_c14n_v1
+    from gateway.app.services.signer import _canonicalize_signing_message
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(signer_module, "orjson", None)
+
+    messages = [
+        {
+            "transaction_id": "tx-test-001",
+            "gateway_timestamp_utc": "2024-01-15T10:30:00.000Z",
+            "final_hash": "sha256:abc123",
+            "policy_version_hash": "sha256:policy123",
+        },
+        {
+            "policy_version_hash": None,
+            "final_hash": 'sha256:"quoted"\\n\x00\u2028',
+            "transaction_id": "tx-ünïcödé- ",
+            "gateway_timestamp_utc": 12345,
+        },
+    ]
+
+    for message in messages:
+        assert _canonicalize_signing_message(message) == json_c14n_v1(message)
+
+
+def test_jwk_public_key_is_cached():
+    """Test that the same JWK resolves to one cached public key object."""
+    from gateway.app.services.signer import _jwk_to_public_key
+
+    jwk_path = Path(__file__).parent.parent / "app" / "dev_keys" / "dev_public.jwk.json"
+    with open(jwk_path, "r") as f:
+        jwk = json.load(f)
+
+    assert _jwk_to_public_key(jwk) is _jwk_to_public_key(dict(jwk))
+
+    with pytest.raises(ValueError, match="Only EC P-256 keys are supported"):
+        _jwk_to_public_key({**jwk, "crv": "P-384"})
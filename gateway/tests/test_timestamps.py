@@ -0,0 +1,36 @@
+"""
+Tests for UTC timestamp parsing helpers.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from gateway.app.services.timestamps import parse_utc_timestamp
+
+
+def test_parse_utc_timestamp_with_z_suffix():
+    """Test that a trailing 'Z' is parsed as UTC."""
+    parsed = parse_utc_timestamp("2024-01-15T10:30:00.123456Z")
+    assert parsed == datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc)
+
+
+def test_parse_utc_timestamp_matches_legacy_replace():
+    """Test equivalence with the previous replace('Z', '+00:00') approach."""
+    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    assert parse_utc_timestamp(now) == datetime.fromisoformat(
+        now.replace("Z", "+00:00")
+    )
+
+
+def test_parse_utc_timestamp_with_offset():
+    """Test that explicit offsets are still accepted."""
+    parsed = parse_utc_timestamp("2024-01-15T10:30:00+00:00")
+    assert parsed.tzinfo is not None
+    assert parsed.utcoffset().total_seconds() == 0
+
+
+def test_parse_utc_timestamp_invalid():
+    """Test that malformed timestamps raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_utc_timestamp("not-a-timestamp")
@@ -6,23 +6,19 @@ import pytest
 from fastapi.testclient import TestClient
 
 from gateway.tests.auth_helpers import create_clinician_headers, create_auditor_headers
-from pathlib import Path
-import tempfile
-import shutil
-from datetime import datetime, timedelta
-import json
+from datetime import timedelta
 
 from gateway.app.main import app
 from gateway.app.db.migrate import get_db_path, ensure_schema, get_connection
 from gateway.app.services.storage import bootstrap_dev_keys
+from gateway.app.services.timestamps import parse_utc_timestamp
 
 
 @pytest.fixture(scope="function")
-def test_db():
+def test_db(temp_db_dir):
     """Create a temporary test database."""
     get_db_path()
-    temp_dir = tempfile.mkdtemp()
-    temp_db_path = Path(temp_dir) / "test.db"
+    temp_db_path = temp_db_dir / "test.db"
 
     import gateway.app.db.migrate as migrate_module
 
@@ -35,7 +31,6 @@ def test_db():
     yield temp_db_path
 
     migrate_module.get_db_path = original_get_db_path
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture(scope="function")
@@ -44,6 +39,38 @@ def client(test_db):
     return TestClient(app)
 
 
+def set_ehr_reference(cert_id, offset, ehr_commit_id):
+    """Set ehr_referenced_at to finalized_at + offset, updating the stored JSON in place."""
+    conn = get_connection()
+    try:
+        cursor = conn.execute(
+            """
+            SELECT json_extract(certificate_json, '$.finalized_at')
+            FROM certificates
+            WHERE certificate_id = ?
+        """,
+            (cert_id,),
+        )
+        finalized_at = parse_utc_timestamp(cursor.fetchone()[0])
+        ehr_referenced_at = (finalized_at + offset).isoformat().replace("+00:00", "Z")
+
+        conn.execute(
+            """
+            UPDATE certificates
+            SET certificate_json = json_set(
+                certificate_json,
+                '$.ehr_referenced_at', ?,
+                '$.ehr_commit_id', ?
+            )
+            WHERE certificate_id = ?
+        """,
+            (ehr_referenced_at, ehr_commit_id, cert_id),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def test_timing_integrity_backdating_detected(client):
     """Test that backdating is detected when finalized_at > ehr_referenced_at."""
     # Issue a certificate
@@ -72,33 +99,8 @@ def test_timing_integrity_backdating_detected(client):
     assert "finalized_at" in certificate
     assert certificate["ehr_referenced_at"] is None  # Not set yet
 
-    # Simulate backdating: set ehr_referenced_at to BEFORE finalized_at
-    conn = get_connection()
-    try:
-        cursor = conn.execute(
-            "SELECT certificate_json FROM certificates WHERE certificate_id = ?",
-            (cert_id,),
-        )
-        row = cursor.fetchone()
-        cert = json.loads(row["certificate_json"])
-
-        # Set EHR reference to 1 hour before finalization (backdating scenario)
-        finalized_at = datetime.fromisoformat(
-            cert["finalized_at"].replace("Z", "+00:00")
-        )
-        ehr_referenced_at = (
-            (finalized_at - timedelta(hours=1)).isoformat().replace("+00:00", "Z")
-        )
-        cert["ehr_referenced_at"] = ehr_referenced_at
-        cert["ehr_commit_id"] = "fake-commit-123"
-
-        conn.execute(
-            "UPDATE certificates SET certificate_json = ? WHERE certificate_id = ?",
-            (json.dumps(cert), cert_id),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    # Simulate backdating: set ehr_referenced_at to 1 hour BEFORE finalized_at
+    set_ehr_reference(cert_id, timedelta(hours=-1), "fake-commit-123")
 
     # Verify the certificate - should fail timing check
     verify_response = client.post(
@@ -150,33 +152,8 @@ def test_timing_integrity_valid_sequence(client):
 
     cert_id = response.json()["certificate_id"]
 
-    # Set ehr_referenced_at to AFTER finalized_at (valid scenario)
-    conn = get_connection()
-    try:
-        cursor = conn.execute(
-            "SELECT certificate_json FROM certificates WHERE certificate_id = ?",
-            (cert_id,),
-        )
-        row = cursor.fetchone()
-        cert = json.loads(row["certificate_json"])
-
-        # Set EHR reference to 1 hour AFTER finalization (valid scenario)
-        finalized_at = datetime.fromisoformat(
-            cert["finalized_at"].replace("Z", "+00:00")
-        )
-        ehr_referenced_at = (
-            (finalized_at + timedelta(hours=1)).isoformat().replace("+00:00", "Z")
-        )
-        cert["ehr_referenced_at"] = ehr_referenced_at
-        cert["ehr_commit_id"] = "valid-commit-456"
-
-        conn.execute(
-            "UPDATE certificates SET certificate_json = ? WHERE certificate_id = ?",
-            (json.dumps(cert), cert_id),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    # Set ehr_referenced_at to 1 hour AFTER finalized_at (valid scenario)
+    set_ehr_reference(cert_id, timedelta(hours=1), "valid-commit-456")
 
     # Verify the certificate - should pass (same tenant)
     verify_response = client.post(
@@ -264,3 +241,119 @@ def test_certificate_includes_governance_fields(client):
     summary = certificate["governance_summary"]
     assert "policy-v2.0" in summary
     assert "gpt-4-test" in summary
+
+
+def test_verify_batch_detects_backdating(client):
+    """Test that batch verification checks many certificates in one request."""
+    tenant_id = "timing-batch-hospital"
+    cert_ids = []
+    for i in range(100):
+        request = {
+            "model_name": "gpt-4",
+            "model_version": "gpt-4-test",
+            "prompt_version": "v1.0",
+            "governance_policy_version": "policy-v1",
+            "note_text": f"Test note {i} for batch verification",
+            "human_reviewed": False,
+        }
+        response = client.post(
+            "/v1/clinical/documentation",
+            json=request,
+            headers=create_clinician_headers(tenant_id),
+        )
+        assert response.status_code == 200
+        cert_ids.append(response.json()["certificate_id"])
+
+    # Backdate one certificate
+    backdated_id = cert_ids[42]
+    set_ehr_reference(backdated_id, timedelta(hours=-1), None)
+
+    verify_response = client.post(
+        "/v1/certificates/verify-batch",
+        json={"certificate_ids": cert_ids},
+        headers=create_auditor_headers(tenant_id),
+    )
+    assert verify_response.status_code == 200
+
+    data = verify_response.json()
+    assert data["total_count"] == 100
+    assert data["valid_count"] == 99
+
+    # Results are returned in request order
+    assert [r["certificate_id"] for r in data["results"]] == cert_ids
+
+    backdated = data["results"][42]
+    assert backdated["valid"] is False
+    assert [f["error"] for f in backdated["failures"]] == [
+        "finalized_after_ehr_reference"
+    ]
+
+
+def test_verify_batch_enforces_tenant_isolation(client):
+    """Test that other tenants' certificates are reported as not found."""
+    request = {
+        "model_name": "gpt-4",
+        "model_version": "gpt-4-test",
+        "prompt_version": "v1.0",
+        "governance_policy_version": "policy-v1",
+        "note_text": "Test note for batch isolation",
+        "human_reviewed": False,
+    }
+    response = client.post(
+        "/v1/clinical/documentation",
+        json=request,
+        headers=create_clinician_headers("timing-batch-owner"),
+    )
+    assert response.status_code == 200
+    cert_id = response.json()["certificate_id"]
+
+    verify_response = client.post(
+        "/v1/certificates/verify-batch",
+        json={"certificate_ids": [cert_id, "does-not-exist"]},
+        headers=create_auditor_headers("timing-batch-other"),
+    )
+    assert verify_response.status_code == 200
+
+    data = verify_response.json()
+    assert data["valid_count"] == 0
+    for result in data["results"]:
+        assert result["valid"] is False
+        assert result["failures"] == [{"check": "certificate", "error": "not_found"}]
+        # Same result shape as a verified certificate
+        report = result["human_friendly_report"]
+        assert report["status"] == "FAIL"
+        assert report["details"][0]["meaning"] == "Certificate not found"
+
+
+def test_verify_batch_rejects_empty_request(client):
+    """Test that an empty batch is rejected by request validation."""
+    verify_response = client.post(
+        "/v1/certificates/verify-batch",
+        json={"certificate_ids": []},
+        headers=create_auditor_headers("timing-batch-hospital"),
+    )
+    assert verify_response.status_code == 422
+
+
+def test_verify_batch_rate_limit_cost_is_per_certificate():
+    """Test that a batch is charged one rate-limit hit per certificate."""
+    import asyncio
+    import json
+
+    from starlette.requests import Request
+
+    from gateway.app.routes.clinical import record_batch_rate_limit_cost
+
+    def make_request(body: bytes) -> Request:
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+    batch = make_request(json.dumps({"certificate_ids": ["a", "b", "c"]}).encode())
+    asyncio.run(record_batch_rate_limit_cost(batch))
+    assert batch.state.rate_limit_cost == 3
+
+    malformed = make_request(b"not json")
+    asyncio.run(record_batch_rate_limit_cost(malformed))
+    assert malformed.state.rate_limit_cost == 1
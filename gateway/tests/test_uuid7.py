@@ -13,3 +13,19 @@ def test_uuid7_byte_ordering_increases():
     time.sleep(0.005)  # 5ms to ensure different timestamp
     b = uuid.UUID(generate_uuid7())
     assert a.bytes < b.bytes
+
+
+def test_uuid7_monotonic_within_same_millisecond():
+    ids = [uuid.UUID(generate_uuid7()) for _ in range(5000)]
+    assert all(u.version == 7 for u in ids)
+    assert all(u.variant == uuid.RFC_4122 for u in ids)
+    assert all(a.bytes < b.bytes for a, b in zip(ids, ids[1:]))
+
+
+def test_uuid7_timestamp_matches_clock():
+    before_ms = time.time_ns() // 1_000_000
+    u = uuid.UUID(generate_uuid7())
+    after_ms = time.time_ns() // 1_000_000
+    timestamp_ms = int.from_bytes(u.bytes[:6], byteorder="big")
+    # Counter overflow may borrow a few milliseconds ahead under heavy load
+    assert before_ms <= timestamp_ms <= after_ms + 5
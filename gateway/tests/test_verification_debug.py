@@ -9,9 +9,6 @@ Tests that:
 
 import pytest
 from fastapi.testclient import TestClient
-from pathlib import Path
-import tempfile
-import shutil
 import json
 
 from gateway.app.main import app
@@ -19,15 +16,14 @@ from gateway.app.db.migrate import get_db_path, ensure_schema
 from gateway.app.services.storage import bootstrap_dev_keys
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a temporary test database."""
+@pytest.fixture(scope="module")
+def test_db(module_temp_db_dir):
+    """Create a temporary test database shared by this module."""
     # Save original db path
     get_db_path()
 
-    # Create temp directory for test db
-    temp_dir = tempfile.mkdtemp()
-    temp_db_path = Path(temp_dir) / "test.db"
+    # Test db lives in a module-scoped temp directory (tmpfs when available)
+    temp_db_path = module_temp_db_dir / "test.db"
 
     # Monkey patch the get_db_path function
     import gateway.app.db.migrate as migrate_module
@@ -43,25 +39,18 @@ def test_db():
 
     # Cleanup
     migrate_module.get_db_path = original_get_db_path
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def client(test_db):
     """Create a test client with temporary database."""
     with TestClient(app) as test_client:
         yield test_client
 
 
-def test_debug_field_contains_no_full_exception_messages(client):
-    """Test that debug fields contain exception types only, not full messages.
-
-    This test ensures the "prefixes only" policy is enforced:
-    - Debug fields should contain exception types (e.g., "ValueError")
-    - Debug fields should NOT contain full exception messages
-    - This prevents information leakage through error messages
-    """
-    # Create a transaction
+@pytest.fixture(scope="module")
+def shared_transaction_id(client):
+    """Create (and sign) one transaction for all tamper tests in this module."""
     request = {
         "prompt": "Test prompt",
         "environment": "dev",
@@ -73,29 +62,59 @@ def test_debug_field_contains_no_full_exception_messages(client):
 
     create_response = client.post("/v1/ai/call", json=request)
     assert create_response.status_code == 200
-    transaction_id = create_response.json()["transaction_id"]
+    return create_response.json()["transaction_id"]
 
-    # Tamper with packet to trigger recomputation failure
-    from gateway.app.services.storage import get_transaction
+
+@pytest.fixture
+def transaction_id(shared_transaction_id):
+    """Yield the shared transaction, restoring its pristine packet afterwards."""
     from gateway.app.db.migrate import get_connection
 
-    packet = get_transaction(transaction_id)
+    conn = get_connection()
+    try:
+        cursor = conn.execute(
+            "SELECT packet_json FROM transactions WHERE transaction_id = ?",
+            (shared_transaction_id,),
+        )
+        original_packet_json = cursor.fetchone()["packet_json"]
+    finally:
+        conn.close()
 
-    # Corrupt the packet structure to trigger an exception during verification
-    # Remove a required field that build_halo_chain needs
-    del packet["policy_receipt"]
+    yield shared_transaction_id
+
+    conn = get_connection()
+    try:
+        conn.execute(
+            "UPDATE transactions SET packet_json = ? WHERE transaction_id = ?",
+            (original_packet_json, shared_transaction_id),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_debug_field_contains_no_full_exception_messages(client, transaction_id):
+    """Test that debug fields contain exception types only, not full messages.
+
+    This test ensures the "prefixes only" policy is enforced:
+    - Debug fields should contain exception types (e.g., "ValueError")
+    - Debug fields should NOT contain full exception messages
+    - This prevents information leakage through error messages
+    """
+    # Tamper with packet to trigger recomputation failure
+    from gateway.app.db.migrate import get_connection
 
-    # Store the corrupted packet
-    packet_json = json.dumps(packet, sort_keys=True)
+    # Corrupt the packet structure to trigger an exception during verification
+    # Remove a required field that build_halo_chain needs (in place, via JSON1)
     conn = get_connection()
     try:
         conn.execute(
             """
             UPDATE transactions
-            SET packet_json = ?
+            SET packet_json = json_remove(packet_json, '$.policy_receipt')
             WHERE transaction_id = ?
         """,
-            (packet_json, transaction_id),
+            (transaction_id,),
         )
         conn.commit()
     finally:
@@ -132,7 +151,7 @@ def test_debug_field_contains_no_full_exception_messages(client):
     assert "missing" not in exception_type.lower()  # No error details
 
 
-def test_failure_schema_consistency(client):
+def test_failure_schema_consistency(client, transaction_id):
     """Test that all failures follow consistent schema.
 
     Verifies that the fail() helper enforces:
@@ -141,43 +160,23 @@ def test_failure_schema_consistency(client):
     - Optional 'debug' field (dict)
     - No 'message' field at top level
     """
-    # Create a transaction
-    request = {
-        "prompt": "Test prompt",
-        "environment": "dev",
-        "client_id": "test-client",
-        "feature_tag": "test",
-        "model": "gpt-4",
-        "temperature": 0.5,
-    }
-
-    create_response = client.post("/v1/ai/call", json=request)
-    assert create_response.status_code == 200
-    transaction_id = create_response.json()["transaction_id"]
-
     # Tamper with both HALO and signature to get multiple failure types
-    from gateway.app.services.storage import get_transaction
     from gateway.app.db.migrate import get_connection
 
-    packet = get_transaction(transaction_id)
-
-    # Tamper with policy_receipt (affects HALO)
-    packet["policy_receipt"]["policy_change_ref"] = "TAMPERED"
-
-    # Tamper with signature
-    packet["verification"]["signature_b64"] = "dGFtcGVyZWQ="
-
-    # Store tampered packet
-    packet_json = json.dumps(packet, sort_keys=True)
+    # Tamper with policy_receipt (affects HALO) and signature in place
     conn = get_connection()
     try:
         conn.execute(
             """
             UPDATE transactions
-            SET packet_json = ?
+            SET packet_json = json_set(
+                packet_json,
+                '$.policy_receipt.policy_change_ref', 'TAMPERED',
+                '$.verification.signature_b64', 'dGFtcGVyZWQ='
+            )
             WHERE transaction_id = ?
         """,
-            (packet_json, transaction_id),
+            (transaction_id,),
         )
         conn.commit()
     finally:
@@ -209,27 +208,13 @@ def test_failure_schema_consistency(client):
             assert "message" not in failure["debug"]
 
 
-def test_hash_prefixes_are_limited_to_16_chars(client):
+def test_hash_prefixes_are_limited_to_16_chars(client, transaction_id):
     """Test that hash prefixes in debug are exactly 16 characters.
 
     Verifies the hash leakage policy:
     - Hash prefixes should be 16 characters (not full hash)
     - Full hashes should never appear in verification responses
     """
-    # Create a transaction
-    request = {
-        "prompt": "Test prompt",
-        "environment": "dev",
-        "client_id": "test-client",
-        "feature_tag": "test",
-        "model": "gpt-4",
-        "temperature": 0.5,
-    }
-
-    create_response = client.post("/v1/ai/call", json=request)
-    assert create_response.status_code == 200
-    transaction_id = create_response.json()["transaction_id"]
-
     # Get original packet to capture full hash
     from gateway.app.services.storage import get_transaction
     from gateway.app.db.migrate import get_connection
@@ -256,18 +241,17 @@ def test_hash_prefixes_are_limited_to_16_chars(client):
     ), f"Expected at least 64 hex chars in hash, got {len(hash_portion)}"
 
     # Tamper with packet field to cause hash mismatch
-    packet["policy_receipt"]["policy_change_ref"] = "TAMPERED"
-
-    packet_json = json.dumps(packet, sort_keys=True)
     conn = get_connection()
     try:
         conn.execute(
             """
             UPDATE transactions
-            SET packet_json = ?
+            SET packet_json = json_set(
+                packet_json, '$.policy_receipt.policy_change_ref', 'TAMPERED'
+            )
             WHERE transaction_id = ?
         """,
-            (packet_json, transaction_id),
+            (transaction_id,),
         )
         conn.commit()
     finally:
@@ -341,3 +325,45 @@ def test_verify_utils_fail_helper():
     assert "check" in f1 and "error" in f1
     assert "check" in f2 and "error" in f2
     assert "check" in f3 and "error" in f3
+
+
+def test_hash_prefix_debug_helper():
+    """Test that hash_prefix_debug() emits 16-char prefixes or nothing."""
+    from gateway.app.routes.verify_utils import HASH_PREFIX_LENGTH, hash_prefix_debug
+
+    stored = "sha256:" + "a" * 64
+    recomputed = "sha256:" + "b" * 64
+
+    debug = hash_prefix_debug(stored, recomputed)
+    assert debug == {
+        "stored_prefix": stored[:HASH_PREFIX_LENGTH],
+        "recomputed_prefix": recomputed[:HASH_PREFIX_LENGTH],
+    }
+    assert len(debug["stored_prefix"]) == 16
+
+    # Missing hashes produce no debug payload
+    assert hash_prefix_debug(None, recomputed) is None
+    assert hash_prefix_debug(stored, "") is None
+
+
+def test_hashes_match_helper():
+    """Test that hashes_match() compares safely and rejects missing values."""
+    from gateway.app.routes.verify_utils import hashes_match
+
+    full_hash = "sha256:" + "a" * 64
+
+    assert hashes_match(full_hash, "sha256:" + "a" * 64) is True
+    assert hashes_match(full_hash, "sha256:" + "a" * 63 + "b") is False
+    assert hashes_match(full_hash, full_hash[:16]) is False
+    assert hashes_match(None, full_hash) is False
+    assert hashes_match(full_hash, None) is False
+    assert hashes_match(None, None) is False
+
+
+def test_exception_debug_helper():
+    """Test that exception_debug() reports the type name only."""
+    from gateway.app.routes.verify_utils import exception_debug
+
+    debug = exception_debug(KeyError("policy_receipt is missing"))
+    assert debug == {"exception": "KeyError"}
+    assert "policy_receipt" not in str(debug)
@@ -7,13 +7,20 @@ The certificate is designed for compliance officers and auditors.
 
 Usage:
     python certificate_pdf.py <certificate.json> [output.pdf]
+    python certificate_pdf.py --batch <certificate.json> [<certificate.json> ...]
+
+In batch mode each certificate is rendered in a separate worker process and
+written next to its JSON file with a .pdf extension.
 """
 
+import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import io
+from typing import BinaryIO, Union
 
 try:
     from reportlab.lib.pagesizes import letter
@@ -27,84 +34,149 @@ except ImportError:
     print("Please install: pip install reportlab pillow")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+
+# Styles are immutable once built, so construct them once per process rather
+# than on every create_certificate_pdf() call.
+_STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=20,
+    textColor=colors.HexColor('#1a1a1a'),
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#333333'),
+    spaceAfter=20,
+    alignment=TA_CENTER,
+    fontName='Helvetica'
+)
+
+SECTION_STYLE = ParagraphStyle(
+    'SectionHeader',
+    parent=_STYLES['Heading3'],
+    fontSize=12,
+    textColor=colors.HexColor('#0066cc'),
+    spaceAfter=10,
+    fontName='Helvetica-Bold'
+)
+
+NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    textColor=colors.HexColor('#1a1a1a'),
+    fontName='Helvetica'
+)
+
+FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    textColor=colors.HexColor('#666666'),
+    alignment=TA_CENTER,
+    fontName='Helvetica-Oblique'
+)
+
+INFO_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0066cc')),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+
+CRYPTO_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Courier'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0066cc')),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+
+
+VERIFICATION_TEXT = """
+    This certificate can be verified offline without contacting the issuer.<br/><br/>
+    
+    <b>To verify:</b><br/>
+    1. Obtain the verification script: verify_clinical_certificate.py<br/>
+    2. Run: python verify_clinical_certificate.py certificate.json<br/>
+    3. The script will validate the HALO chain and cryptographic signature<br/><br/>
+    
+    <b>What this certificate proves:</b><br/>
+    • AI documentation governance was executed at the time of generation<br/>
+    • Note integrity is tamper-evident (any modification breaks the chain)<br/>
+    • Certificate cannot be forged or backdated without cryptographic key<br/>
+    • All governance checks listed above were performed<br/><br/>
+    
+    <b>What is NOT stored:</b><br/>
+    • No Protected Health Information (PHI) in plaintext<br/>
+    • No raw clinical note text<br/>
+    • Only cryptographic hashes for integrity verification
+    """
+
+# The instructions never change, so their markup is parsed once and the same
+# flowable is reused for every certificate (platypus re-wraps it per build).
+VERIFICATION_PARAGRAPH = Paragraph(VERIFICATION_TEXT, NORMAL_STYLE)
+
 
 def load_certificate(filepath: str) -> dict:
-    """Load certificate JSON from file."""
-    try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"❌ Error: Certificate file not found: {filepath}")
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON in certificate file: {e}")
-        sys.exit(1)
+    """
+    Load certificate JSON from file.
+    
+    Raises FileNotFoundError or json.JSONDecodeError (orjson's error
+    subclasses it); main() reports them, so library callers can recover.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 
-def create_certificate_pdf(packet: dict, output_path: str):
+def create_certificate_pdf(packet: dict, output: Union[str, BinaryIO]):
     """
     Generate a professional PDF certificate.
     
     Args:
         packet: The accountability packet/certificate
-        output_path: Path to save the PDF
+        output: Path to save the PDF, or a binary file-like object (e.g.
+            io.BytesIO) to write it to without touching the filesystem
     """
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
+    doc = SimpleDocTemplate(output, pagesize=letter)
     story = []
     
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#333333'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica'
-    )
-    
-    section_style = ParagraphStyle(
-        'SectionHeader',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#0066cc'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#1a1a1a'),
-        fontName='Helvetica'
-    )
-    
     # Title
     story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("CLINICAL AI DOCUMENTATION", title_style))
-    story.append(Paragraph("INTEGRITY CERTIFICATE", title_style))
+    story.append(Paragraph("CLINICAL AI DOCUMENTATION", TITLE_STYLE))
+    story.append(Paragraph("INTEGRITY CERTIFICATE", TITLE_STYLE))
     story.append(Spacer(1, 0.3*inch))
     
     # Subtitle
-    story.append(Paragraph("Cryptographically Verifiable Governance Proof", subtitle_style))
+    story.append(Paragraph("Cryptographically Verifiable Governance Proof", SUBTITLE_STYLE))
     story.append(Spacer(1, 0.5*inch))
     
     # Certificate Information Section
-    story.append(Paragraph("Certificate Information", section_style))
+    story.append(Paragraph("Certificate Information", SECTION_STYLE))
     
     # Extract data
     cert_id = packet['transaction_id']
@@ -139,17 +211,7 @@ def create_certificate_pdf(packet: dict, output_path: str):
         info_data.append(['Reviewer:', human_editor])
     
     info_table = Table(info_data, colWidths=[2*inch, 4.5*inch])
-    info_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0066cc')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-    ]))
+    info_table.setStyle(INFO_TABLE_STYLE)
     
     story.append(info_table)
     story.append(Spacer(1, 0.3*inch))
@@ -158,13 +220,13 @@ def create_certificate_pdf(packet: dict, output_path: str):
     if governance_metadata:
         checks = governance_metadata.get('governance_checks', [])
         if checks:
-            story.append(Paragraph("Governance Checks Executed", section_style))
+            story.append(Paragraph("Governance Checks Executed", SECTION_STYLE))
             checks_text = "<br/>".join([f"✓ {check}" for check in checks])
-            story.append(Paragraph(checks_text, normal_style))
+            story.append(Paragraph(checks_text, NORMAL_STYLE))
             story.append(Spacer(1, 0.3*inch))
     
     # Cryptographic Proof Section
-    story.append(Paragraph("Cryptographic Proof", section_style))
+    story.append(Paragraph("Cryptographic Proof", SECTION_STYLE))
     
     final_hash = packet['halo_chain']['final_hash']
     signature = packet['verification']['signature_b64']
@@ -175,83 +237,83 @@ def create_certificate_pdf(packet: dict, output_path: str):
     ]
     
     crypto_table = Table(crypto_data, colWidths=[2*inch, 4.5*inch])
-    crypto_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Courier'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0066cc')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-    ]))
+    crypto_table.setStyle(CRYPTO_TABLE_STYLE)
     
     story.append(crypto_table)
     story.append(Spacer(1, 0.3*inch))
     
     # Verification Instructions
-    story.append(Paragraph("Verification Instructions", section_style))
-    
-    verification_text = """
-    This certificate can be verified offline without contacting the issuer.<br/><br/>
-    
-    <b>To verify:</b><br/>
-    1. Obtain the verification script: verify_clinical_certificate.py<br/>
-    2. Run: python verify_clinical_certificate.py certificate.json<br/>
-    3. The script will validate the HALO chain and cryptographic signature<br/><br/>
-    
-    <b>What this certificate proves:</b><br/>
-    • AI documentation governance was executed at the time of generation<br/>
-    • Note integrity is tamper-evident (any modification breaks the chain)<br/>
-    • Certificate cannot be forged or backdated without cryptographic key<br/>
-    • All governance checks listed above were performed<br/><br/>
-    
-    <b>What is NOT stored:</b><br/>
-    • No Protected Health Information (PHI) in plaintext<br/>
-    • No raw clinical note text<br/>
-    • Only cryptographic hashes for integrity verification
-    """
-    
-    story.append(Paragraph(verification_text, normal_style))
+    story.append(Paragraph("Verification Instructions", SECTION_STYLE))
+    story.append(VERIFICATION_PARAGRAPH)
     story.append(Spacer(1, 0.3*inch))
     
     # Footer
     story.append(Spacer(1, 0.5*inch))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#666666'),
-        alignment=TA_CENTER,
-        fontName='Helvetica-Oblique'
-    )
-    
     story.append(Paragraph(
         "This certificate is generated by ELI Sentinel Clinical Documentation Integrity Layer",
-        footer_style
+        FOOTER_STYLE
     ))
     story.append(Paragraph(
         f"Certificate Hash (first 16 chars): {final_hash[:16]}",
-        footer_style
+        FOOTER_STYLE
     ))
     
     # Build PDF
     doc.build(story)
 
 
+def _render_certificate(certificate_path: str) -> str:
+    """Render one certificate JSON file to a PDF beside it (batch worker)."""
+    output_path = str(Path(certificate_path).with_suffix(".pdf"))
+    try:
+        packet = load_certificate(certificate_path)
+    except (OSError, ValueError) as e:
+        # Name the file, and hand the parent an exception that always pickles
+        raise ValueError(f"{certificate_path}: {e}") from None
+    create_certificate_pdf(packet, output_path)
+    return output_path
+
+
 def main():
     """Main execution flow."""
     
     if len(sys.argv) < 2:
         print("Usage: python certificate_pdf.py <certificate.json> [output.pdf]")
+        print("       python certificate_pdf.py --batch <certificate.json> [...]")
         sys.exit(1)
     
+    if sys.argv[1] == "--batch":
+        certificate_paths = sys.argv[2:]
+        if not certificate_paths:
+            print("❌ Error: --batch requires at least one certificate file")
+            sys.exit(1)
+        
+        # Each PDF build is independent, CPU-bound work
+        workers = min(len(certificate_paths), os.cpu_count() or 1)
+        print(f"\n📄 Generating {len(certificate_paths)} PDF certificates ({workers} workers)")
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for output_path in executor.map(_render_certificate, certificate_paths):
+                    print(f"   Output: {output_path}")
+        except ValueError as e:
+            print(f"❌ Error: Cannot load certificate {e}")
+            sys.exit(1)
+        
+        print("✅ Certificate PDFs generated successfully!\n")
+        return
+    
     certificate_path = sys.argv[1]
     output_path = sys.argv[2] if len(sys.argv) > 2 else "certificate.pdf"
     
     print(f"\n📄 Loading certificate from: {certificate_path}")
-    packet = load_certificate(certificate_path)
+    try:
+        packet = load_certificate(certificate_path)
+    except FileNotFoundError:
+        print(f"❌ Error: Certificate file not found: {certificate_path}")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"❌ Error: Invalid JSON in certificate file: {e}")
+        sys.exit(1)
     
     print(f"📄 Generating PDF certificate: {output_path}")
     create_certificate_pdf(packet, output_path)
@@ -21,39 +21,47 @@ import sys
 import re
 from pathlib import Path
 
-# Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
+# Match table rows with HTTP method and path
+# Pattern: | GET | /v1/something | ...
+# The table is plain ASCII, so \s needs no Unicode whitespace lookups.
+ROW_PATTERN = re.compile(
+    r"^\|\s*(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s*\|\s*(`[^`]+`|[^\|]+)\s*\|",
+    re.MULTILINE | re.ASCII,
+)
 
-def get_openapi_endpoints() -> list[tuple[str, str]]:
+
+def get_openapi_endpoints() -> frozenset[tuple[str, str]]:
     """
     Load the FastAPI app and extract all registered endpoints from OpenAPI.
 
     Returns:
-        Sorted list of (METHOD, path) tuples
+        Set of (METHOD, path) tuples
     """
     import os
     os.environ.setdefault("ENV", "TEST")
     os.environ.setdefault("DISABLE_RATE_LIMITS", "1")
 
-    from gateway.app.db.migrate import ensure_schema
-    from gateway.app.main import app
+    # Add project root to path
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
 
-    ensure_schema()
+    from gateway.app.main import app
 
-    # FastAPI's openapi() method generates the schema without a running server
+    # Route registration does not touch the database, so no migrations are
+    # needed here. FastAPI's openapi() method generates the schema without a
+    # running server and caches it on the app.
     schema = app.openapi()
 
-    endpoints = []
-    for path, methods in schema.get("paths", {}).items():
-        for method in methods:
-            endpoints.append((method.upper(), path))
-
-    return sorted(endpoints)
+    return frozenset(
+        (method.upper(), path)
+        for path, methods in schema.get("paths", {}).items()
+        for method in methods
+    )
 
 
-def get_docs_endpoints(docs_path: Path) -> list[tuple[str, str]]:
+def get_docs_endpoints(docs_path: Path) -> frozenset[tuple[str, str]]:
     """
     Parse endpoint table from docs/CONTRACT_SNAPSHOT.md.
 
@@ -61,27 +69,20 @@ def get_docs_endpoints(docs_path: Path) -> list[tuple[str, str]]:
         | METHOD | /path/to/endpoint | ...
 
     Returns:
-        Sorted list of (METHOD, path) tuples
+        Set of (METHOD, path) tuples
     """
     content = docs_path.read_text()
 
-    endpoints = []
-    # Match table rows with HTTP method and path
-    # Pattern: | GET | /v1/something | ...
-    row_pattern = re.compile(
-        r"^\|\s*(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s*\|\s*(`[^`]+`|[^\|]+)\s*\|",
-        re.MULTILINE,
-    )
-
-    for match in row_pattern.finditer(content):
+    endpoints = set()
+    for match in ROW_PATTERN.finditer(content):
         method = match.group(1).upper().strip()
         raw_path = match.group(2).strip().strip("`")
         # Normalize path (strip trailing spaces, backticks)
         path = raw_path.strip()
         if path.startswith("/"):
-            endpoints.append((method, path))
+            endpoints.add((method, path))
 
-    return sorted(set(endpoints))
+    return frozenset(endpoints)
 
 
 def main() -> int:
@@ -98,21 +99,21 @@ def main() -> int:
         return 2
 
     try:
-        docs_endpoints = get_docs_endpoints(docs_path)
+        docs_set = get_docs_endpoints(docs_path)
     except Exception as e:
         print(f"ERROR parsing docs: {e}", file=sys.stderr)
         return 2
 
-    # Load live OpenAPI endpoints
+    # Load live OpenAPI endpoints. The app (and every router it pulls in) is
+    # only imported once the docs table has been parsed, so a missing or
+    # unreadable docs file fails fast.
     try:
-        live_endpoints = get_openapi_endpoints()
+        live_set = get_openapi_endpoints()
     except Exception as e:
         print(f"ERROR loading app: {e}", file=sys.stderr)
         return 2
 
-    docs_set = set(docs_endpoints)
-    live_set = set(live_endpoints)
-
+    # Only the (small) diffs are sorted, for printing
     in_code_not_docs = live_set - docs_set
     in_docs_not_code = docs_set - live_set
 
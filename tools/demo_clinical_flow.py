@@ -15,15 +15,46 @@ Usage:
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 OUTPUT_DIR = Path("/tmp/clinical_demo")
 
+SUMMARIZE_URL = f"{BASE_URL}/v1/mock/summarize"
+DOCUMENTATION_URL = f"{BASE_URL}/v1/clinical/documentation"
+TRANSACTIONS_URL = f"{BASE_URL}/v1/transactions"
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Step 1 input is fixed, so its request body is serialized once
+CLINICAL_TEXT = """
+    Patient presented to clinic with complaints of persistent headache
+    for 3 days. No fever, no visual changes. Vital signs stable.
+    Physical exam unremarkable. Assessed as tension headache.
+    Recommended OTC analgesics and stress management. Follow up PRN.
+    """
+
+SUMMARIZE_BODY = json.dumps({
+    "clinical_text": CLINICAL_TEXT,
+    "note_type": "progress_note",
+    "ai_model": "gpt-4-turbo"
+}).encode("utf-8")
+
+# One keep-alive session for all demo calls, so the gateway connection is
+# set up once instead of per request
+SESSION = requests.Session()
+SESSION.mount(BASE_URL, HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def setup_output_dir():
     """Create output directory for demo artifacts."""
@@ -39,32 +70,29 @@ def setup_output_dir():
     print(f"📁 Output directory: {OUTPUT_DIR}\n")
 
 
+def write_json(path: Path, obj: dict):
+    """Save obj as indented JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
 def step1_mock_summarize():
     """Step 1: Call mock AI summarizer."""
     print("=" * 70)
     print("STEP 1: Mock AI Clinical Summarizer")
     print("=" * 70)
     
-    clinical_text = """
-    Patient presented to clinic with complaints of persistent headache
-    for 3 days. No fever, no visual changes. Vital signs stable.
-    Physical exam unremarkable. Assessed as tension headache.
-    Recommended OTC analgesics and stress management. Follow up PRN.
-    """
-    
-    request_data = {
-        "clinical_text": clinical_text,
-        "note_type": "progress_note",
-        "ai_model": "gpt-4-turbo"
-    }
-    
     print(f"\n📝 Sending clinical text to AI summarizer...")
-    print(f"   Text length: {len(clinical_text)} characters")
+    print(f"   Text length: {len(CLINICAL_TEXT)} characters")
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/v1/mock/summarize",
-            json=request_data,
+        response = SESSION.post(
+            SUMMARIZE_URL,
+            data=SUMMARIZE_BODY,
+            headers=JSON_HEADERS,
             timeout=10
         )
         response.raise_for_status()
@@ -117,8 +145,8 @@ def step2_generate_certificate(summary_data: dict):
     print(f"   Human Reviewed: {request_data['human_reviewed']}")
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/v1/clinical/documentation",
+        response = SESSION.post(
+            DOCUMENTATION_URL,
             json=request_data,
             timeout=10
         )
@@ -138,8 +166,7 @@ def step2_generate_certificate(summary_data: dict):
         # For demo, we'll construct it from the response
         print(f"\n💾 Saving certificate to: {cert_file}")
         
-        with open(cert_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        write_json(cert_file, result)
         
         print(f"✅ Certificate saved!")
         
@@ -161,8 +188,8 @@ def step3_fetch_full_packet(certificate_id: str):
     print(f"\n🔍 Fetching full packet for verification...")
     
     try:
-        response = requests.get(
-            f"{BASE_URL}/v1/transactions/{certificate_id}",
+        response = SESSION.get(
+            f"{TRANSACTIONS_URL}/{certificate_id}",
             timeout=10
         )
         response.raise_for_status()
@@ -171,8 +198,7 @@ def step3_fetch_full_packet(certificate_id: str):
         
         # Save full packet for verification
         packet_file = OUTPUT_DIR / f"packet_{certificate_id[:8]}.json"
-        with open(packet_file, 'w') as f:
-            json.dump(packet, f, indent=2)
+        write_json(packet_file, packet)
         
         print(f"✅ Full packet retrieved and saved")
         print(f"   File: {packet_file}")
@@ -198,29 +224,15 @@ def step4_verify_certificate(packet_file: Path):
     print(f"\n🔍 Verifying certificate offline...")
     print(f"   Using: {packet_file}")
     
-    import subprocess
-    
-    verify_script = Path(__file__).parent / "verify_clinical_certificate.py"
-    
     try:
-        result = subprocess.run(
-            ["python", str(verify_script), str(packet_file)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        # Sibling tool, called in-process rather than through a fresh interpreter
+        import verify_clinical_certificate
         
-        print(result.stdout)
-        
-        if result.returncode == 0:
+        if verify_clinical_certificate.verify_certificate_file(str(packet_file)):
             print("\n✅ Certificate verification completed successfully!")
         else:
             print("\n⚠️  Certificate verification had issues")
-            if result.stderr:
-                print(f"   Error: {result.stderr}")
                 
-    except subprocess.TimeoutExpired:
-        print("\n❌ Verification timed out")
     except Exception as e:
         print(f"\n❌ Error running verification: {e}")
 
@@ -237,37 +249,32 @@ def step5_generate_pdf(packet_file: Path):
     
     print(f"\n📄 Generating PDF certificate...")
     
-    import subprocess
-    
-    pdf_script = Path(__file__).parent / "certificate_pdf.py"
     pdf_output = OUTPUT_DIR / f"certificate_{packet_file.stem}.pdf"
     
     try:
-        result = subprocess.run(
-            ["python", str(pdf_script), str(packet_file), str(pdf_output)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        # Imported here: certificate_pdf exits at import time without
+        # reportlab, which should only cost this step, not the whole demo
+        import certificate_pdf
         
-        print(result.stdout)
+        packet = certificate_pdf.load_certificate(str(packet_file))
+        certificate_pdf.create_certificate_pdf(packet, str(pdf_output))
         
-        if result.returncode == 0:
-            print(f"✅ PDF certificate generated!")
-            print(f"   Location: {pdf_output}")
-        else:
-            print(f"\n⚠️  PDF generation had issues")
-            if result.stderr:
-                print(f"   Error: {result.stderr}")
+        print(f"✅ PDF certificate generated!")
+        print(f"   Location: {pdf_output}")
                 
-    except subprocess.TimeoutExpired:
-        print("\n❌ PDF generation timed out")
+    except SystemExit:
+        print("\n❌ Error generating PDF: PDF dependencies are not installed")
     except Exception as e:
         print(f"\n❌ Error generating PDF: {e}")
 
 
 def main():
     """Main demo flow."""
+    # Each step prints dozens of short lines: buffer them and write each
+    # step's output in one go instead of flushing line by line on a terminal
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("\n" + "=" * 70)
     print("  CLINICAL DOCUMENTATION INTEGRITY LAYER - DEMO")
     print("=" * 70)
@@ -281,20 +288,26 @@ def main():
     
     # Setup
     setup_output_dir()
+    sys.stdout.flush()
     
-    # Step 1: Mock AI summarizer
-    summary_data = step1_mock_summarize()
-    
-    # Step 2: Generate certificate
-    certificate_data, cert_file = step2_generate_certificate(summary_data)
-    
-    # Step 3: Fetch full packet
-    certificate_id = certificate_data['certificate_id']
-    packet, packet_file = step3_fetch_full_packet(certificate_id)
+    with SESSION:
+        # Step 1: Mock AI summarizer
+        summary_data = step1_mock_summarize()
+        sys.stdout.flush()
+        
+        # Step 2: Generate certificate
+        certificate_data, cert_file = step2_generate_certificate(summary_data)
+        sys.stdout.flush()
+        
+        # Step 3: Fetch full packet
+        certificate_id = certificate_data['certificate_id']
+        packet, packet_file = step3_fetch_full_packet(certificate_id)
+        sys.stdout.flush()
     
     # Step 4: Verify certificate
     if packet_file:
         step4_verify_certificate(packet_file)
+        sys.stdout.flush()
     
     # Step 5: Generate PDF
     if packet_file:
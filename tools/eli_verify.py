@@ -11,13 +11,25 @@ Exit Codes:
     3  - Signature invalid
     4  - Key unavailable
     10 - Schema invalid
+
+With --packet-dir, every *.json packet in the directory is verified against
+the same key and the exit code is the highest of the per-packet codes.
+Batch output is always one JSON line per failing packet plus a summary, so
+--json applies to --packet only.
 """
 
 import argparse
+import copy
+import hashlib
 import json
+import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,11 +37,42 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from gateway.app.services.halo import verify_halo_chain
 from gateway.app.services.signer import verify_signature
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Required keys of the packet's halo and signature sections
+_HALO_REQUIRED = frozenset({"halo_version", "blocks", "block_hashes", "final_hash"})
+_SIGNATURE_REQUIRED = frozenset({"message", "signature_b64"})
+
+# Reports of recently verified packets, keyed by (packet digest, JWK digest).
+# Verification is a pure function of the packet and key, so re-verifying a
+# bit-identical packet (overlapping audit batches) can reuse the report.
+# Opt-in only: hashing and copying cost more than a one-off verification.
+_VERIFY_CACHE_SIZE = 1024
+_verify_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
 
 def load_json_file(path: str) -> Dict[str, Any]:
-    """Load and parse a JSON file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load and parse a JSON file (UTF-8)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@lru_cache(maxsize=32)
+def _load_jwk_file(jwk_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Load a JWK file, cached per (path, modification time).
+    
+    Auditors verifying many packets signed by the same tenant key read and
+    parse the key file once; a rewritten file gets a new mtime and is reloaded.
+    The public key object itself is cached by the signer, keyed on the JWK
+    coordinates.
+    """
+    return load_json_file(jwk_path)
 
 
 def fetch_jwk(keys_url: Optional[str] = None, jwk_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -45,7 +88,7 @@ def fetch_jwk(keys_url: Optional[str] = None, jwk_path: Optional[str] = None) ->
     """
     if jwk_path:
         try:
-            return load_json_file(jwk_path)
+            return _load_jwk_file(jwk_path, os.stat(jwk_path).st_mtime_ns)
         except Exception as e:
             print(f"Error loading JWK from {jwk_path}: {e}", file=sys.stderr)
             return None
@@ -68,6 +111,18 @@ def validate_schema(packet: Dict[str, Any]) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, errors)
     """
+    # Fast path: a well-formed packet passes two subset checks, and the
+    # per-field error messages below are only built for a broken one
+    halo = packet.get("halo")
+    sig = packet.get("signature")
+    if (
+        isinstance(halo, dict)
+        and isinstance(sig, dict)
+        and _HALO_REQUIRED <= halo.keys()
+        and _SIGNATURE_REQUIRED <= sig.keys()
+    ):
+        return True, []
+    
     errors = []
     
     # Check for halo chain
@@ -97,9 +152,16 @@ def validate_schema(packet: Dict[str, Any]) -> tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+def _json_digest(obj: Any) -> bytes:
+    """SHA-256 of the sorted, compact JSON encoding of obj."""
+    encoded = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).digest()
+
+
 def verify_packet(
     packet: Dict[str, Any],
-    jwk: Optional[Dict[str, Any]] = None
+    jwk: Optional[Dict[str, Any]] = None,
+    use_cache: bool = False
 ) -> Dict[str, Any]:
     """
     Verify an accountability packet.
@@ -107,10 +169,35 @@ def verify_packet(
     Args:
         packet: Full packet dictionary
         jwk: Optional JWK for signature verification
+        use_cache: Reuse the report of an identical packet/JWK pair verified
+            earlier in this process (default False always runs the full checks)
         
     Returns:
         Verification report dictionary
     """
+    if not use_cache:
+        return _verify_packet(packet, jwk)
+    
+    cache_key = (_json_digest(packet), _json_digest(jwk))
+    with _verify_cache_lock:
+        cached = _verify_cache.get(cache_key)
+        if cached is not None:
+            _verify_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+    
+    report = _verify_packet(packet, jwk)
+    with _verify_cache_lock:
+        _verify_cache[cache_key] = copy.deepcopy(report)
+        if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return report
+
+
+def _verify_packet(
+    packet: Dict[str, Any],
+    jwk: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run schema, HALO chain and signature checks (see verify_packet)."""
     report = {
         "schema_valid": False,
         "halo_valid": False,
@@ -163,67 +250,128 @@ def verify_packet(
     return report
 
 
-def format_human_report(report: Dict[str, Any], packet: Dict[str, Any]) -> str:
-    """Format verification report for human reading."""
-    lines = []
-    lines.append("=" * 70)
-    lines.append("ELI SENTINEL OFFLINE VERIFICATION REPORT")
-    lines.append("=" * 70)
-    lines.append("")
+def _iter_report(report: Dict[str, Any], packet: Dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of the human-readable verification report."""
+    yield "=" * 70
+    yield "ELI SENTINEL OFFLINE VERIFICATION REPORT"
+    yield "=" * 70
+    yield ""
     
     # Transaction info
     halo = packet.get("halo", {})
     if halo.get("blocks"):
         block1 = halo["blocks"][0]
-        lines.append(f"Transaction ID:  {block1.get('transaction_id', 'N/A')}")
-        lines.append(f"Timestamp:       {block1.get('gateway_timestamp_utc', 'N/A')}")
-        lines.append(f"Environment:     {block1.get('environment', 'N/A')}")
-        lines.append("")
+        yield f"Transaction ID:  {block1.get('transaction_id', 'N/A')}"
+        yield f"Timestamp:       {block1.get('gateway_timestamp_utc', 'N/A')}"
+        yield f"Environment:     {block1.get('environment', 'N/A')}"
+        yield ""
     
     # Results
-    lines.append("VERIFICATION RESULTS:")
-    lines.append(f"  Schema:     {'✓ PASS' if report['schema_valid'] else '✗ FAIL'}")
-    lines.append(f"  HALO Chain: {'✓ PASS' if report['halo_valid'] else '✗ FAIL'}")
+    yield "VERIFICATION RESULTS:"
+    yield f"  Schema:     {'✓ PASS' if report['schema_valid'] else '✗ FAIL'}"
+    yield f"  HALO Chain: {'✓ PASS' if report['halo_valid'] else '✗ FAIL'}"
     
     if report['signature_valid'] is True:
-        lines.append(f"  Signature:  ✓ PASS")
+        yield f"  Signature:  ✓ PASS"
     elif report['signature_valid'] is False:
-        lines.append(f"  Signature:  ✗ FAIL")
+        yield f"  Signature:  ✗ FAIL"
     else:
-        lines.append(f"  Signature:  ⚠ SKIPPED (no key provided)")
+        yield f"  Signature:  ⚠ SKIPPED (no key provided)"
     
-    lines.append("")
-    lines.append(f"OVERALL: {'✓ VALID' if report['overall_valid'] else '✗ INVALID'}")
+    yield ""
+    yield f"OVERALL: {'✓ VALID' if report['overall_valid'] else '✗ INVALID'}"
     
     # Errors
     if report["errors"]:
-        lines.append("")
-        lines.append("ERRORS:")
+        yield ""
+        yield "ERRORS:"
         for error in report["errors"]:
-            lines.append(f"  • {error}")
+            yield f"  • {error}"
     
     # Warnings
     if report["warnings"]:
-        lines.append("")
-        lines.append("WARNINGS:")
+        yield ""
+        yield "WARNINGS:"
         for warning in report["warnings"]:
-            lines.append(f"  • {warning}")
+            yield f"  • {warning}"
+    
+    yield ""
+    yield "=" * 70
+
+
+def format_human_report(report: Dict[str, Any], packet: Dict[str, Any]) -> str:
+    """Format verification report for human reading."""
+    return "\n".join(_iter_report(report, packet))
+
+
+def report_exit_code(report: Dict[str, Any]) -> int:
+    """Map a verification report to the CLI exit code (see module docstring)."""
+    if not report["schema_valid"]:
+        return 10
+    elif not report["halo_valid"]:
+        return 2
+    elif report["signature_valid"] is False:
+        return 3
+    elif report["overall_valid"]:
+        return 0
+    else:
+        return 1
+
+
+def verify_packet_dir(
+    packet_dir: str,
+    jwk: Optional[Dict[str, Any]] = None,
+    use_cache: bool = False
+) -> int:
+    """
+    Verify every *.json packet in a directory against the same JWK.
+    
+    Packets are verified on a thread pool (signature checks run in
+    cryptography's C backend). One JSON line is printed per failing packet,
+    followed by a summary.
+    
+    Returns:
+        Highest per-packet exit code (0 if every packet passed)
+    """
+    paths = sorted(Path(packet_dir).glob("*.json"))
+    if not paths:
+        print(f"Error: No packet files (*.json) in {packet_dir}", file=sys.stderr)
+        return 1
+    
+    def verify_file(path: Path) -> tuple[Path, Dict[str, Any], int]:
+        try:
+            packet = load_json_file(str(path))
+        except Exception as e:
+            return path, {"errors": [f"Error loading packet: {e}"]}, 10
+        report = verify_packet(packet, jwk, use_cache=use_cache)
+        return path, report, report_exit_code(report)
     
-    lines.append("")
-    lines.append("=" * 70)
+    exit_code = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        for path, report, code in executor.map(verify_file, paths):
+            if code:
+                failed += 1
+                exit_code = max(exit_code, code)
+                print(json.dumps({"packet": str(path), "exit_code": code, "report": report}))
     
-    return "\n".join(lines)
+    print(f"Verified {len(paths)} packets: {len(paths) - failed} passed, {failed} failed")
+    return exit_code
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Verify ELI Sentinel accountability packets offline"
     )
-    parser.add_argument(
+    packet_source = parser.add_mutually_exclusive_group(required=True)
+    packet_source.add_argument(
         "--packet",
-        required=True,
         help="Path to packet JSON file"
     )
+    packet_source.add_argument(
+        "--packet-dir",
+        help="Verify every *.json packet in this directory (batch mode)"
+    )
     parser.add_argument(
         "--jwk",
         help="Path to JWK public key file"
@@ -235,17 +383,27 @@ def main():
     parser.add_argument(
         "--json",
         action="store_true",
-        help="Output machine-readable JSON report"
+        help="Output machine-readable JSON report (--packet only)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse reports of bit-identical packets verified earlier in the run"
     )
     
     args = parser.parse_args()
+    if args.packet_dir and args.json:
+        # Batch mode always prints one JSON line per failing packet
+        parser.error("--json cannot be used with --packet-dir")
     
     # Load packet
-    try:
-        packet = load_json_file(args.packet)
-    except Exception as e:
-        print(f"Error loading packet: {e}", file=sys.stderr)
-        sys.exit(10)
+    packet = None
+    if args.packet:
+        try:
+            packet = load_json_file(args.packet)
+        except Exception as e:
+            print(f"Error loading packet: {e}", file=sys.stderr)
+            sys.exit(10)
     
     # Load JWK if provided
     jwk = None
@@ -255,26 +413,20 @@ def main():
             print("Error: Could not load JWK", file=sys.stderr)
             sys.exit(4)
     
+    if args.packet_dir:
+        sys.exit(verify_packet_dir(args.packet_dir, jwk, use_cache=args.cache))
+    
     # Verify packet
-    report = verify_packet(packet, jwk)
+    report = verify_packet(packet, jwk, use_cache=args.cache)
     
     # Output report
     if args.json:
         print(json.dumps(report, indent=2))
     else:
-        print(format_human_report(report, packet))
+        sys.stdout.writelines(f"{line}\n" for line in _iter_report(report, packet))
     
     # Determine exit code
-    if not report["schema_valid"]:
-        sys.exit(10)
-    elif not report["halo_valid"]:
-        sys.exit(2)
-    elif report["signature_valid"] is False:
-        sys.exit(3)
-    elif report["overall_valid"]:
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    sys.exit(report_exit_code(report))
 
 
 if __name__ == "__main__":
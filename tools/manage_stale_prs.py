@@ -14,15 +14,46 @@ Usage:
     
     # Close specific PR numbers
     python tools/manage_stale_prs.py --pr-numbers 42,43,44
+
+With --close, PRs are closed in parallel; add --serial to close them one
+at a time.
 """
 
 import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
 
+# Concurrent gh calls when closing; kept low to stay clear of GitHub's
+# secondary rate limits
+CLOSE_WORKERS = 8
+
+# Open PRs, 100 per page; gh --paginate follows $endCursor until done
+OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!, $endCursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 100, after: $endCursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title updatedAt isDraft
+        author { login }
+        labels(first: 20) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+# Reshape nodes like `gh pr list --json` (deleted authors come back as null)
+OPEN_PRS_JQ = (
+    ".data.repository.pullRequests.nodes[]"
+    ' | .author = (.author // {login: "ghost"})'
+    " | .labels = .labels.nodes"
+)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -51,37 +82,50 @@ def parse_args():
         action="store_true",
         help="Actually close the stale PRs (requires GitHub CLI 'gh' to be installed and authenticated)",
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Close PRs one at a time instead of in parallel (for debugging)",
+    )
     parser.add_argument(
         "--repo",
         type=str,
         default="Swixixle/CLINICAL-DOCUMENTATION-INTEGRITY-LAYER",
         help="GitHub repository (default: Swixixle/CLINICAL-DOCUMENTATION-INTEGRITY-LAYER)",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    # The GraphQL query needs the owner and name separately
+    owner, _, name = args.repo.partition("/")
+    if not owner or not name or "/" in name:
+        parser.error(f"--repo must be in owner/name form, got {args.repo!r}")
+    return args
 
 
 def get_open_prs(repo: str) -> List[Dict[str, Any]]:
-    """Fetch open PRs using GitHub CLI."""
+    """Fetch all open PRs using GitHub CLI (paginated, no 100-PR cap)."""
+    owner, name = repo.split("/", 1)
     try:
         result = subprocess.run(
             [
                 "gh",
-                "pr",
-                "list",
-                "--repo",
-                repo,
-                "--state",
-                "open",
-                "--json",
-                "number,title,updatedAt,author,isDraft,labels",
-                "--limit",
-                "100",
+                "api",
+                "graphql",
+                "--paginate",
+                "-f",
+                f"query={OPEN_PRS_QUERY}",
+                "-f",
+                f"owner={owner}",
+                "-f",
+                f"name={name}",
+                "--jq",
+                OPEN_PRS_JQ,
             ],
             capture_output=True,
             text=True,
             check=True,
         )
-        return json.loads(result.stdout)
+        # One compact JSON object per line, across all pages
+        return [json.loads(line) for line in result.stdout.splitlines() if line]
     except subprocess.CalledProcessError as e:
         print(f"Error fetching PRs: {e.stderr}", file=sys.stderr)
         sys.exit(1)
@@ -93,8 +137,8 @@ def get_open_prs(repo: str) -> List[Dict[str, Any]]:
         sys.exit(1)
 
 
-def is_stale_pr(pr: Dict[str, Any], days_threshold: int) -> bool:
-    """Determine if a PR is stale based on criteria."""
+def is_stale_pr(pr: Dict[str, Any], threshold_date: datetime) -> bool:
+    """Determine if a PR is stale (last updated before threshold_date)."""
     # Must have [WIP] in title
     if "[WIP]" not in pr["title"]:
         return False
@@ -107,7 +151,6 @@ def is_stale_pr(pr: Dict[str, Any], days_threshold: int) -> bool:
 
     # Check last update time
     updated_at = datetime.fromisoformat(pr["updatedAt"].replace("Z", "+00:00"))
-    threshold_date = datetime.now(timezone.utc) - timedelta(days=days_threshold)
 
     return updated_at < threshold_date
 
@@ -115,7 +158,30 @@ def is_stale_pr(pr: Dict[str, Any], days_threshold: int) -> bool:
 def close_pr(repo: str, pr_number: int, comment: str) -> bool:
     """Close a PR with a comment."""
     try:
-        # Add comment
+        # Comment and close in one gh call
+        subprocess.run(
+            [
+                "gh",
+                "pr",
+                "close",
+                str(pr_number),
+                "--repo",
+                repo,
+                "--comment",
+                comment,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        if "unknown flag" not in e.stderr:
+            print(f"Error closing PR #{pr_number}: {e.stderr}", file=sys.stderr)
+            return False
+
+    # Older gh without `pr close --comment`: comment first, then close
+    try:
         subprocess.run(
             [
                 "gh",
@@ -129,13 +195,13 @@ def close_pr(repo: str, pr_number: int, comment: str) -> bool:
             ],
             check=True,
             capture_output=True,
+            text=True,
         )
-
-        # Close PR
         subprocess.run(
             ["gh", "pr", "close", str(pr_number), "--repo", repo],
             check=True,
             capture_output=True,
+            text=True,
         )
         return True
     except subprocess.CalledProcessError as e:
@@ -158,7 +224,8 @@ def main():
         print(f"Targeting specific PRs: {target_numbers}")
     else:
         # Filter to stale PRs
-        target_prs = [pr for pr in all_prs if is_stale_pr(pr, args.days)]
+        threshold_date = datetime.now(timezone.utc) - timedelta(days=args.days)
+        target_prs = [pr for pr in all_prs if is_stale_pr(pr, threshold_date)]
         print(f"Found {len(target_prs)} stale [WIP] Copilot PRs")
 
     if not target_prs:
@@ -186,9 +253,19 @@ def main():
             "If this PR should remain open, please reopen it and remove the [WIP] prefix."
         )
 
-        for pr in target_prs:
+        def close(pr: Dict[str, Any]) -> bool:
+            return close_pr(args.repo, pr["number"], close_comment)
+
+        if args.serial:
+            results = map(close, target_prs)
+        else:
+            # Each close is a GitHub API round trip; overlap them
+            with ThreadPoolExecutor(max_workers=CLOSE_WORKERS) as executor:
+                results = list(executor.map(close, target_prs))
+
+        for pr, closed in zip(target_prs, results):
             print(f"\nClosing PR #{pr['number']}...", end=" ")
-            if close_pr(args.repo, pr["number"], close_comment):
+            if closed:
                 print("✓ Closed")
             else:
                 print("✗ Failed")
@@ -7,6 +7,11 @@ requiring internet access or API calls.
 
 Usage:
     python verify_bundle.py <defense_bundle.zip>
+    python verify_bundle.py --dir <bundle_directory>
+
+With --dir, every *.zip in the directory is verified in parallel and one
+PASS/FAIL/ERROR line is printed per bundle; the exit code is the worst
+result.
 
 Exit Codes:
     0 - PASS: Certificate valid and unmodified
@@ -28,25 +33,38 @@ This tool is designed for:
 - Compliance audits
 """
 
+import contextlib
+import io
+import os
 import sys
 import json
 import zipfile
 import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, Tuple
 import base64
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
 
-# Color codes for terminal output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
-BOLD = '\033[1m'
+# Color codes for terminal output; plain text when redirected (logs, audit
+# archives) or when NO_COLOR is set
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+GREEN = '\033[92m' if _USE_COLOR else ''
+RED = '\033[91m' if _USE_COLOR else ''
+YELLOW = '\033[93m' if _USE_COLOR else ''
+BLUE = '\033[94m' if _USE_COLOR else ''
+RESET = '\033[0m' if _USE_COLOR else ''
+BOLD = '\033[1m' if _USE_COLOR else ''
 
 
 def print_header(text: str):
-    """Print a formatted header."""
+    """Print a formatted header, first writing out the previous step's lines."""
+    sys.stdout.flush()
     print(f"\n{BOLD}{BLUE}{'='*70}{RESET}")
     print(f"{BOLD}{BLUE}{text:^70}{RESET}")
     print(f"{BOLD}{BLUE}{'='*70}{RESET}\n")
@@ -72,10 +90,44 @@ def print_info(text: str):
     print(f"{BLUE}ℹ {text}{RESET}")
 
 
+def canonicalize(obj: Any) -> bytes:
+    """
+    Serialize obj the way the gateway signs it: sorted keys, no whitespace,
+    non-ASCII emitted as raw UTF-8.
+
+    orjson produces the same bytes for the string/bool/null fields of the
+    signed message; stdlib json is used when it is missing or rejects a value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        obj, separators=(',', ':'), ensure_ascii=False, sort_keys=True
+    ).encode('utf-8')
+
+
+@lru_cache(maxsize=32)
+def load_public_key(public_key_pem: bytes):
+    """
+    Parse a PEM public key.
+
+    Cached by PEM bytes: bundles issued by the same tenant carry the same
+    key, so repeated verifications skip the PEM/ASN.1 parse.
+    """
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_public_key(public_key_pem)
+
+
 def extract_bundle(zip_path: str) -> Tuple[bool, Dict[str, Any]]:
     """
     Extract and validate defense bundle ZIP.
     
+    File contents are kept as raw bytes; json.loads and the PEM loader
+    accept bytes directly, so nothing is decoded to str.
+    
     Returns:
         (success, contents_dict)
     """
@@ -110,7 +162,7 @@ def extract_bundle(zip_path: str) -> Tuple[bool, Dict[str, Any]]:
             
             # Extract all required files
             for filename in required_files:
-                contents[filename] = zf.read(filename).decode('utf-8')
+                contents[filename] = zf.read(filename)
                 print_success(f"Extracted: {filename}")
         
         print_success("Bundle extraction complete")
@@ -124,12 +176,12 @@ def extract_bundle(zip_path: str) -> Tuple[bool, Dict[str, Any]]:
         return False, {}
 
 
-def verify_canonical_hash(contents: Dict[str, Any]) -> Tuple[bool, str]:
+def verify_canonical_hash(contents: Dict[str, Any]) -> Tuple[bool, str, bytes, Dict[str, Any]]:
     """
     Recompute canonical hash and verify integrity.
     
     Returns:
-        (success, computed_hash)
+        (success, computed_hash, canonical_bytes, canonical_message)
     """
     print_header("STEP 2: VERIFY CANONICAL HASH")
     
@@ -138,8 +190,7 @@ def verify_canonical_hash(contents: Dict[str, Any]) -> Tuple[bool, str]:
         canonical_message = json.loads(contents['canonical_message.json'])
         
         # Canonicalize: sorted keys, no whitespace
-        canonical_json = json.dumps(canonical_message, separators=(',', ':'), sort_keys=True)
-        canonical_bytes = canonical_json.encode('utf-8')
+        canonical_bytes = canonicalize(canonical_message)
         
         # Compute SHA-256 hash
         computed_hash = hashlib.sha256(canonical_bytes).hexdigest()
@@ -163,33 +214,34 @@ def verify_canonical_hash(contents: Dict[str, Any]) -> Tuple[bool, str]:
             print_success("All required provenance fields present")
         
         print_success("Canonical hash computed successfully")
-        return True, computed_hash
+        return True, computed_hash, canonical_bytes, canonical_message
         
     except json.JSONDecodeError as e:
         print_error(f"Invalid JSON in canonical_message.json: {str(e)}")
-        return False, ""
+        return False, "", b"", {}
     except Exception as e:
         print_error(f"Hash computation failed: {str(e)}")
-        return False, ""
+        return False, "", b"", {}
 
 
-def verify_signature(contents: Dict[str, Any], canonical_hash: str) -> bool:
+def verify_signature(
+    contents: Dict[str, Any], certificate: Dict[str, Any], canonical_bytes: bytes
+) -> bool:
     """
     Verify ECDSA signature with public key.
     
+    canonical_bytes are the signed bytes already built by verify_canonical_hash.
+    
     Returns:
         success
     """
     print_header("STEP 3: VERIFY ECDSA SIGNATURE")
     
     try:
-        from cryptography.hazmat.primitives import serialization, hashes
+        from cryptography.hazmat.primitives import hashes
         from cryptography.hazmat.primitives.asymmetric import ec
         from cryptography.exceptions import InvalidSignature
         
-        # Load certificate
-        certificate = json.loads(contents['certificate.json'])
-        
         # Get signature
         signature_b64 = certificate.get('signature', {}).get('signature')
         if not signature_b64:
@@ -201,15 +253,10 @@ def verify_signature(contents: Dict[str, Any], canonical_hash: str) -> bool:
         
         # Load public key
         public_key_pem = contents['public_key.pem']
-        public_key = serialization.load_pem_public_key(public_key_pem.encode('utf-8'))
+        public_key = load_public_key(public_key_pem)
         
         print_success("Public key loaded")
         
-        # Get canonical message bytes (what was signed)
-        canonical_message = json.loads(contents['canonical_message.json'])
-        canonical_json = json.dumps(canonical_message, separators=(',', ':'), sort_keys=True)
-        canonical_bytes = canonical_json.encode('utf-8')
-        
         # Verify signature
         try:
             public_key.verify(
@@ -233,7 +280,7 @@ def verify_signature(contents: Dict[str, Any], canonical_hash: str) -> bool:
         return False
 
 
-def verify_chain_integrity(contents: Dict[str, Any]) -> bool:
+def verify_chain_integrity(certificate: Dict[str, Any]) -> bool:
     """
     Verify integrity chain linkage.
     
@@ -243,8 +290,6 @@ def verify_chain_integrity(contents: Dict[str, Any]) -> bool:
     print_header("STEP 4: VERIFY CHAIN INTEGRITY")
     
     try:
-        certificate = json.loads(contents['certificate.json'])
-        
         chain = certificate.get('integrity_chain', {})
         chain_hash = chain.get('chain_hash')
         previous_hash = chain.get('previous_hash')
@@ -269,7 +314,9 @@ def verify_chain_integrity(contents: Dict[str, Any]) -> bool:
         return False
 
 
-def verify_human_attestation(contents: Dict[str, Any]) -> bool:
+def verify_human_attestation(
+    certificate: Dict[str, Any], canonical_message: Dict[str, Any]
+) -> bool:
     """
     Verify human attestation integrity.
     
@@ -279,9 +326,6 @@ def verify_human_attestation(contents: Dict[str, Any]) -> bool:
     print_header("STEP 5: VERIFY HUMAN ATTESTATION")
     
     try:
-        certificate = json.loads(contents['certificate.json'])
-        canonical_message = json.loads(contents['canonical_message.json'])
-        
         # Check if human reviewed
         human_reviewed = certificate.get('human_reviewed', False)
         
@@ -355,23 +399,13 @@ def print_summary(certificate: Dict[str, Any], all_checks_passed: bool):
     print()
 
 
-def main():
-    """Main verification flow."""
-    # Check arguments
-    if len(sys.argv) != 2:
-        print(f"\n{BOLD}Usage:{RESET}")
-        print(f"  python verify_bundle.py <defense_bundle.zip>\n")
-        print(f"{BOLD}Description:{RESET}")
-        print("  Verify the integrity of a tamper-evident defense bundle offline.")
-        print("  No internet or API access required.\n")
-        print(f"{BOLD}Exit Codes:{RESET}")
-        print("  0 = PASS (valid)")
-        print("  1 = FAIL (invalid)")
-        print("  2 = ERROR (bundle issue)\n")
-        sys.exit(2)
-    
-    zip_path = sys.argv[1]
+def verify_bundle_file(zip_path: str) -> int:
+    """
+    Run all verification steps on one bundle, printing the full report.
     
+    Returns:
+        exit code (0 = PASS, 1 = FAIL, 2 = ERROR)
+    """
     print_header("DEFENSE BUNDLE VERIFICATION")
     print_info(f"Bundle: {Path(zip_path).name}")
     print_info("Mode: OFFLINE (no network required)")
@@ -380,38 +414,141 @@ def main():
     success, contents = extract_bundle(zip_path)
     if not success:
         print_error("Bundle extraction failed")
-        sys.exit(2)
+        return 2
     
-    # Load certificate for summary
+    # Parse the certificate once; every later step reuses it
     try:
         certificate = json.loads(contents['certificate.json'])
     except:
         print_error("Cannot parse certificate.json")
-        sys.exit(2)
+        return 2
     
     # Step 2: Verify canonical hash
-    success, canonical_hash = verify_canonical_hash(contents)
+    success, canonical_hash, canonical_bytes, canonical_message = verify_canonical_hash(
+        contents
+    )
     if not success:
         print_summary(certificate, False)
-        sys.exit(1)
+        return 1
     
     # Step 3: Verify signature
-    signature_valid = verify_signature(contents, canonical_hash)
+    # A bad signature already means FAIL, so skip the remaining checks
+    if not verify_signature(contents, certificate, canonical_bytes):
+        print_summary(certificate, False)
+        return 1
     
     # Step 4: Verify chain integrity
-    chain_valid = verify_chain_integrity(contents)
+    chain_valid = verify_chain_integrity(certificate)
     
     # Step 5: Verify human attestation
-    attestation_valid = verify_human_attestation(contents)
+    attestation_valid = verify_human_attestation(certificate, canonical_message)
     
     # Determine overall result
-    all_checks_passed = signature_valid and chain_valid and attestation_valid
+    all_checks_passed = chain_valid and attestation_valid
     
     # Print summary
     print_summary(certificate, all_checks_passed)
     
+    return 0 if all_checks_passed else 1
+
+
+def _verify_bundle_quiet(zip_path: str) -> int:
+    """Batch worker: verify one bundle, discarding its step-by-step report."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return verify_bundle_file(zip_path)
+
+
+def verify_bundle_dir(bundle_dir: str) -> int:
+    """
+    Verify every *.zip bundle in bundle_dir across worker processes.
+    
+    Prints one PASS/FAIL/ERROR line per bundle and a summary.
+    
+    Returns:
+        worst exit code across all bundles (2 if none were found)
+    """
+    print_header("DEFENSE BUNDLE BATCH VERIFICATION")
+    
+    directory = Path(bundle_dir)
+    if not directory.is_dir():
+        print_error(f"Directory not found: {bundle_dir}")
+        return 2
+    
+    zip_paths = sorted(str(p) for p in directory.glob("*.zip"))
+    if not zip_paths:
+        print_error(f"No .zip bundles found in: {bundle_dir}")
+        return 2
+    
+    print_info(f"Directory: {directory}")
+    print_info(f"Bundles: {len(zip_paths)}")
+    print_info("Mode: OFFLINE (no network required)")
+    print()
+    
+    # Each bundle is independent, CPU-bound work (zip, SHA-256, ECDSA)
+    workers = min(len(zip_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_verify_bundle_quiet, zip_path): zip_path
+            for zip_path in zip_paths
+        }
+        codes = {}
+        for future in as_completed(futures):
+            try:
+                codes[futures[future]] = future.result()
+            except Exception:
+                codes[futures[future]] = 2
+    
+    for zip_path in zip_paths:
+        name = Path(zip_path).name
+        code = codes[zip_path]
+        if code == 0:
+            print_success(f"PASS   {name}")
+        elif code == 1:
+            print_error(f"FAIL   {name}")
+        else:
+            print_warning(f"ERROR  {name}")
+    
+    passed = sum(1 for code in codes.values() if code == 0)
+    failed = sum(1 for code in codes.values() if code == 1)
+    errors = len(codes) - passed - failed
+    
+    print_header("BATCH SUMMARY")
+    print(f"  Passed: {passed}")
+    print(f"  Failed: {failed}")
+    print(f"  Errors: {errors}")
+    print()
+    
+    return max(codes.values())
+
+
+def main():
+    """Main verification flow."""
+    # Check arguments
+    batch = len(sys.argv) == 3 and sys.argv[1] == "--dir"
+    if len(sys.argv) != 2 and not batch:
+        print(f"\n{BOLD}Usage:{RESET}")
+        print(f"  python verify_bundle.py <defense_bundle.zip>")
+        print("  python verify_bundle.py --dir <bundle_directory>\n")
+        print(f"{BOLD}Description:{RESET}")
+        print("  Verify the integrity of a tamper-evident defense bundle offline.")
+        print("  With --dir, verify every *.zip bundle in a directory in parallel.")
+        print("  No internet or API access required.\n")
+        print(f"{BOLD}Exit Codes:{RESET}")
+        print("  0 = PASS (valid)")
+        print("  1 = FAIL (invalid)")
+        print("  2 = ERROR (bundle issue)\n")
+        sys.exit(2)
+    
+    # Each step prints a burst of short lines: buffer them and write one
+    # step at a time (print_header flushes) instead of line by line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
+    if batch:
+        sys.exit(verify_bundle_dir(sys.argv[2]))
+    
     # Exit with appropriate code
-    sys.exit(0 if all_checks_passed else 1)
+    sys.exit(verify_bundle_file(sys.argv[1]))
 
 
 if __name__ == "__main__":
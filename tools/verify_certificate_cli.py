@@ -27,6 +27,19 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Make the gateway package importable when run from a checkout. Done once
+# here rather than per call, so verifying many certificates in one process
+# doesn't keep growing sys.path; the gateway imports stay inside the checks
+# so a missing dependency is reported as a failed check.
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 # ANSI color codes
 class Colors:
     GREEN = '\033[92m'
@@ -40,8 +53,10 @@ class Colors:
 def load_certificate(filepath: str) -> Dict[str, Any]:
     """Load certificate JSON from file."""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     except FileNotFoundError:
         print(f"{Colors.RED}❌ Error: Certificate file not found: {filepath}{Colors.RESET}")
         sys.exit(1)
@@ -77,7 +92,6 @@ def verify_chain_hash(certificate: Dict[str, Any]) -> tuple[bool, str]:
     """Verify integrity chain hash."""
     try:
         # Import verification utilities
-        sys.path.insert(0, str(Path(__file__).parent.parent))
         from gateway.app.services.hashing import hash_c14n
         
         # Recompute chain hash
@@ -115,8 +129,6 @@ def verify_signature(certificate: Dict[str, Any]) -> tuple[bool, str]:
     """Verify cryptographic signature."""
     try:
         # Import verification utilities
-        from pathlib import Path as PathLib
-        sys.path.insert(0, str(PathLib(__file__).parent.parent))
         from gateway.app.services.signer import verify_signature as verify_sig
         
         signature_bundle = certificate.get("signature", {})
@@ -128,7 +140,7 @@ def verify_signature(certificate: Dict[str, Any]) -> tuple[bool, str]:
             return False, "Missing signature components"
         
         # Try to load public key (from dev keys or fail gracefully)
-        jwk_path = PathLib(__file__).parent.parent / "gateway" / "app" / "dev_keys" / "dev_public.jwk.json"
+        jwk_path = PROJECT_ROOT / "gateway" / "app" / "dev_keys" / "dev_public.jwk.json"
         
         try:
             with open(jwk_path, 'r') as f:
@@ -20,18 +20,22 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 def load_certificate(filepath: str) -> dict:
-    """Load certificate JSON from file."""
-    try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"❌ Error: Certificate file not found: {filepath}")
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON in certificate file: {e}")
-        sys.exit(1)
+    """
+    Load certificate JSON from file.
+    
+    Raises FileNotFoundError or json.JSONDecodeError (orjson's error
+    subclasses it); main() reports them, so library callers can recover.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def verify_halo_chain(packet: dict) -> bool:
@@ -196,15 +200,16 @@ def display_certificate_info(packet: dict):
     print("\n" + "="*70)
 
 
-def main():
-    """Main verification flow."""
-    
-    if len(sys.argv) != 2:
-        print("Usage: python verify_clinical_certificate.py <certificate.json>")
-        sys.exit(1)
+def verify_certificate_file(certificate_path: str) -> bool:
+    """
+    Load, display and verify a certificate file, printing the report.
     
-    certificate_path = sys.argv[1]
+    Returns:
+        True if both the HALO chain and the signature are valid
     
+    Raises:
+        FileNotFoundError, json.JSONDecodeError: if the file can't be loaded
+    """
     print(f"\n🔍 Loading certificate from: {certificate_path}")
     packet = load_certificate(certificate_path)
     
@@ -245,8 +250,28 @@ def main():
         print("  • Forged")
     print("-"*70 + "\n")
     
+    return halo_valid and signature_valid
+
+
+def main():
+    """Main verification flow."""
+    
+    if len(sys.argv) != 2:
+        print("Usage: python verify_clinical_certificate.py <certificate.json>")
+        sys.exit(1)
+    
+    certificate_path = sys.argv[1]
+    try:
+        valid = verify_certificate_file(certificate_path)
+    except FileNotFoundError:
+        print(f"❌ Error: Certificate file not found: {certificate_path}")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"❌ Error: Invalid JSON in certificate file: {e}")
+        sys.exit(1)
+    
     # Exit with appropriate code
-    sys.exit(0 if (halo_valid and signature_valid) else 1)
+    sys.exit(0 if valid else 1)
 
 
 if __name__ == "__main__":
@@ -26,8 +26,9 @@ Exit codes:
 import argparse
 import json
 import os
+import sqlite3
 import sys
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Union
 
 # Allow running as `python tools/verify_ledger_integrity.py` without setting
 # PYTHONPATH manually: insert the repo root so gateway imports resolve.
@@ -38,8 +39,10 @@ if _REPO_ROOT not in sys.path:
 try:
     from gateway.app.db.ledger_hashing import (
         HASH_POLICY,
+        MERKLE_POLICY,
         ORDERING,
         compute_event_hash,
+        compute_merkle_root,
         hash_content,  # noqa: F401 - re-exported for tests
     )
 except ImportError as _import_err:
@@ -102,23 +105,34 @@ def _columns_postgres(cur: Any, table: str) -> Set[str]:
 
 
 def _fetch_events_sqlite(
-    db_path: str, tenant_id: Optional[str]
+    db: Union[str, sqlite3.Connection], tenant_id: Optional[str]
 ) -> list[Dict[str, Any]]:
-    import sqlite3
+    # An already-open connection (e.g. ":memory:") is used as-is and left open
+    if isinstance(db, sqlite3.Connection):
+        return _query_events_sqlite(db, tenant_id)
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    conn = sqlite3.connect(db)
+    try:
+        return _query_events_sqlite(conn, tenant_id)
+    finally:
+        conn.close()
 
+
+def _query_events_sqlite(
+    conn: sqlite3.Connection, tenant_id: Optional[str]
+) -> list[Dict[str, Any]]:
     missing = _REQUIRED_COLUMNS - _columns_sqlite(conn, "audit_events")
     if missing:
-        conn.close()
         raise ValueError(
             f"Missing columns in audit_events (inspected via PRAGMA table_info): "
             f"{sorted(missing)}"
         )
 
+    # Row factory on the cursor only, so a caller's connection is not modified
+    cur = conn.cursor()
+    cur.row_factory = sqlite3.Row
     if tenant_id:
-        rows = conn.execute(
+        rows = cur.execute(
             """
             SELECT event_id, tenant_id, occurred_at_utc, object_type, object_id,
                    action, event_payload_json, prev_event_hash, event_hash
@@ -129,7 +143,7 @@ def _fetch_events_sqlite(
             (tenant_id,),
         ).fetchall()
     else:
-        rows = conn.execute(
+        rows = cur.execute(
             """
             SELECT event_id, tenant_id, occurred_at_utc, object_type, object_id,
                    action, event_payload_json, prev_event_hash, event_hash
@@ -138,7 +152,7 @@ def _fetch_events_sqlite(
             """,
         ).fetchall()
     events = [dict(r) for r in rows]
-    conn.close()
+    cur.close()
     return events
 
 
@@ -194,7 +208,10 @@ def _fetch_events_postgres(
 
 
 def fetch_events(
-    engine: str, db_path: str, pg_url: str, tenant_id: Optional[str]
+    engine: str,
+    db_path: Union[str, sqlite3.Connection],
+    pg_url: str,
+    tenant_id: Optional[str],
 ) -> list[Dict[str, Any]]:
     if engine == "sqlite":
         return _fetch_events_sqlite(db_path, tenant_id)
@@ -210,13 +227,17 @@ def fetch_events(
 
 def verify(
     engine: str,
-    db_path: str,
-    pg_url: str,
+    db_path: Union[str, sqlite3.Connection],
+    pg_url: str = "",
     tenant_id: Optional[str] = None,
     verbose: bool = False,
 ) -> Dict[str, Any]:
     """Verify audit event hash chain integrity.
 
+    For the sqlite engine, db_path may be a file path or an open
+    sqlite3.Connection (which is left open), and pg_url may be omitted:
+    in-process callers can simply use verify("sqlite", db_path).
+
     Returns a result dict with keys:
         status          "PASS" | "FAIL" | "ERROR"
         valid           bool (backward-compatible alias for status=="PASS")
@@ -228,6 +249,9 @@ def verify(
         tenant_count    int
         failure         None | {index, reason, event_id}   (first failure only)
         errors          list of all failures
+        merkle_policy   str
+        merkle_roots    {tenant_id: RFC 6962 tree head over stored event hashes}
+                        (PASS only; empty when the chain was rejected)
     """
     base: Dict[str, Any] = {
         "engine": engine,
@@ -239,6 +263,8 @@ def verify(
         "failure": None,
         "valid": False,
         "errors": [],
+        "merkle_policy": MERKLE_POLICY,
+        "merkle_roots": {},
     }
 
     try:
@@ -326,6 +352,14 @@ def verify(
         chain.append({"event_id": event_id, "event_hash": stored_hash})
 
     passed = len(errors) == 0
+    # Only publish tree heads for a chain that verified
+    merkle_roots = {}
+    if passed:
+        merkle_roots = {
+            tenant: compute_merkle_root([e["event_hash"] for e in chain])
+            for tenant, chain in tenant_chains.items()
+        }
+
     first_failure = None
     if errors:
         e = errors[0]
@@ -344,6 +378,7 @@ def verify(
         "tenant_count": len(tenant_chains),
         "failure": first_failure,
         "errors": errors,
+        "merkle_roots": merkle_roots,
     }
 
 